@@ -24,6 +24,27 @@ const actionColors: Record<Recommendation['action'], string> = {
   'all-in': '#8e24aa',   // purple
 };
 
+const indicatorStyle: React.CSSProperties = {
+  borderRadius: '50%',
+  display: 'inline-block',
+  width: 16,
+  height: 16,
+  marginRight: 8,
+  verticalAlign: 'middle',
+};
+
+// Per-action label and indicator style, built once instead of on every render
+const actionLabels = Object.fromEntries(
+  Object.keys(actionColors).map((action) => [action, action.toUpperCase()])
+) as Partial<Record<string, string>>;
+
+const actionIndicatorStyles = Object.fromEntries(
+  Object.entries(actionColors).map(([action, color]) => [
+    action,
+    { ...indicatorStyle, backgroundColor: color },
+  ])
+) as Partial<Record<string, React.CSSProperties>>;
+
 // Utility: map OverlaySettings to OverlayConfiguration
 function mapSettingsToConfig(settings: OverlaySettings): OverlayConfiguration {
   // These theme/display values can be customized or made user-configurable as needed
@@ -117,19 +138,11 @@ export const OverlayWindow: React.FC<OverlayWindowProps> = ({
         <div className="overlay-action" aria-label={`Recommended action: ${recommendation.action}`}>
           <span
             className="overlay-action-indicator"
-            style={{
-              backgroundColor: actionColors[recommendation.action],
-              borderRadius: '50%',
-              display: 'inline-block',
-              width: 16,
-              height: 16,
-              marginRight: 8,
-              verticalAlign: 'middle',
-            }}
+            style={actionIndicatorStyles[recommendation.action] ?? indicatorStyle}
             aria-hidden="true"
           />
           <span className="overlay-action-text" style={{ fontWeight: 700 }}>
-            {recommendation.action.toUpperCase()}
+            {actionLabels[recommendation.action] ?? recommendation.action.toUpperCase()}
           </span>
         </div>
       )}
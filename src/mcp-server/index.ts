@@ -21,6 +21,7 @@ import { DecisionEngine } from '../modules/DecisionEngine';
 import { GameStateManager } from '../modules/GameStateManager';
 import { SecurityManager } from '../modules/SecurityManager';
 import { Logger } from '../utils/logger';
+import { createId } from '../utils/id';
 
 interface MCPServerConfig {
   port?: number;
@@ -51,7 +52,11 @@ interface RecommendationCache {
 export class PokerMCPServer extends EventEmitter {
   private httpServer?: http.Server;
   private wsServer?: WebSocketServer;
-  private gameStates: Map<string, GameStateResource> = new Map();
+  /** Ring of the most recent game states, overwritten oldest first */
+  private gameStates: (GameStateResource | undefined)[];
+  private gameStateIndex = 0;
+  /** Serialized /api/game-state/current body, cleared whenever the ring changes */
+  private currentGameStateJson: string | null = null;
   private recommendations: Map<string, RecommendationCache> = new Map();
   private decisionEngine: DecisionEngine | undefined;
   private gameStateManager: GameStateManager | undefined;
@@ -77,6 +82,9 @@ export class PokerMCPServer extends EventEmitter {
       cacheTimeout: 300000, // 5 minutes
       ...config,
     };
+    this.gameStates = new Array<GameStateResource | undefined>(
+      Math.max(1, this.config.maxGameStates!)
+    ).fill(undefined);
 
     this.logger = new Logger('PokerMCPServer');
     this.startCleanupTimer();
@@ -161,7 +169,7 @@ export class PokerMCPServer extends EventEmitter {
    * Handle HTTP requests
    */
   private handleHttpRequest(req: http.IncomingMessage, res: http.ServerResponse): void {
-    const startTime = Date.now();
+    const startTime = performance.now();
     this.metrics.httpRequests++;
 
     // Set CORS headers
@@ -193,7 +201,7 @@ export class PokerMCPServer extends EventEmitter {
       this.logger.error('Error handling HTTP request', { url, method, error });
       this.sendError(res, 500, 'Internal server error');
     } finally {
-      this.updateResponseTime(Date.now() - startTime);
+      this.updateResponseTime(performance.now() - startTime);
     }
   }
 
@@ -203,10 +211,14 @@ export class PokerMCPServer extends EventEmitter {
   private handleGetRequest(url: string, res: http.ServerResponse): void {
     switch (url) {
       case '/api/game-state/current':
-        this.sendResponse(res, this.getCurrentGameState());
+        // Clients poll this between frames; serialize each state once
+        if (this.currentGameStateJson === null) {
+          this.currentGameStateJson = JSON.stringify(this.getCurrentGameState(), null, 2);
+        }
+        this.sendJson(res, this.currentGameStateJson);
         break;
       case '/api/game-state/history':
-        this.sendResponse(res, this.getGameStateHistory());
+        this.streamGameStateHistory(res);
         break;
       case '/api/recommendations/current':
         this.sendResponse(res, this.getCurrentRecommendations());
@@ -293,21 +305,23 @@ export class PokerMCPServer extends EventEmitter {
    * Handle game state updates from GameStateManager
    */
   private handleGameStateUpdate(gameState: GameState): void {
-    const id = `gs_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
-    
-    this.gameStates.set(id, {
+    // One clock read stamps the id, the stored state and the broadcast
+    const now = Date.now();
+    const id = createId('gs', now);
+
+    // The ring caps the history at maxGameStates; expired states go in the cleanup timer
+    this.gameStates[this.gameStateIndex] = {
       gameState,
-      timestamp: Date.now(),
+      timestamp: now,
       id,
-    });
+    };
+    this.gameStateIndex = (this.gameStateIndex + 1) % this.gameStates.length;
+    this.currentGameStateJson = null;
 
     this.metrics.gameStatesProcessed++;
 
     // Broadcast to WebSocket clients
-    this.broadcastEvent('game_state_updated', { gameState, id });
-
-    // Cleanup old states
-    this.cleanupOldGameStates();
+    this.broadcastEvent('game_state_updated', { gameState, id }, now);
   }
 
   /**
@@ -323,17 +337,18 @@ export class PokerMCPServer extends EventEmitter {
       const { gameState, options = {} } = data;
       const recommendation = await this.decisionEngine.getRecommendation(gameState, options);
       
-      const id = `rec_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+      const now = Date.now();
+      const id = createId('rec', now);
       this.recommendations.set(id, {
         recommendation,
-        timestamp: Date.now(),
+        timestamp: now,
         gameStateId: gameState.id || 'unknown',
       });
 
       this.metrics.recommendationsGenerated++;
 
       // Broadcast to WebSocket clients
-      this.broadcastEvent('recommendation_generated', { recommendation, id });
+      this.broadcastEvent('recommendation_generated', { recommendation, id }, now);
 
       this.sendResponse(res, { recommendation, id });
     } catch (error) {
@@ -391,14 +406,26 @@ export class PokerMCPServer extends EventEmitter {
    * Send JSON response
    */
   private sendResponse(res: http.ServerResponse, data: any): void {
+    this.sendJson(res, JSON.stringify(data, null, 2));
+  }
+
+  /**
+   * Send an already serialized JSON response
+   */
+  private sendJson(res: http.ServerResponse, json: string): void {
     res.writeHead(200);
-    res.end(JSON.stringify(data, null, 2));
+    res.end(json);
   }
 
   /**
    * Send error response
    */
   private sendError(res: http.ServerResponse, code: number, message: string): void {
+    // A streamed response that fails midway cannot be turned into an error response
+    if (res.headersSent) {
+      res.destroy();
+      return;
+    }
     res.writeHead(code);
     res.end(JSON.stringify({
       error: {
@@ -413,18 +440,29 @@ export class PokerMCPServer extends EventEmitter {
    * Get current game state
    */
   private getCurrentGameState(): any {
-    const states = Array.from(this.gameStates.values());
-    const latest = states.sort((a, b) => b.timestamp - a.timestamp)[0];
-    
+    const size = this.gameStates.length;
+    const latest = this.gameStates[(this.gameStateIndex - 1 + size) % size];
+
     return latest ? latest.gameState : null;
   }
 
   /**
-   * Get game state history
+   * Stream the game state history, newest first, one serialized state per write instead
+   * of building a single string for the whole history
    */
-  private getGameStateHistory(): any {
-    const states = Array.from(this.gameStates.values());
-    return states.sort((a, b) => b.timestamp - a.timestamp);
+  private streamGameStateHistory(res: http.ServerResponse): void {
+    res.writeHead(200);
+    res.write('[');
+    const size = this.gameStates.length;
+    let first = true;
+    for (let age = 1; age <= size; age++) {
+      const state = this.gameStates[(this.gameStateIndex - age + size) % size];
+      if (state) {
+        res.write((first ? '\n' : ',\n') + JSON.stringify(state, null, 2));
+        first = false;
+      }
+    }
+    res.end(first ? ']' : '\n]');
   }
 
   /**
@@ -450,10 +488,10 @@ export class PokerMCPServer extends EventEmitter {
   /**
    * Broadcast event to all WebSocket clients
    */
-  private broadcastEvent(type: string, data: any): void {
+  private broadcastEvent(type: string, data: any, timestamp: number = Date.now()): void {
     if (!this.wsServer) return;
 
-    const message = JSON.stringify({ type, data, timestamp: Date.now() });
+    const message = JSON.stringify({ type, data, timestamp });
     
     this.wsServer.clients.forEach((client: WebSocket) => {
       if (client.readyState === WebSocket.OPEN) {
@@ -466,8 +504,9 @@ export class PokerMCPServer extends EventEmitter {
    * Update average response time metric
    */
   private updateResponseTime(responseTime: number): void {
-    this.metrics.avgResponseTime = 
-      (this.metrics.avgResponseTime + responseTime) / 2;
+    // Incremental mean over every request counted in httpRequests
+    this.metrics.avgResponseTime +=
+      (responseTime - this.metrics.avgResponseTime) / this.metrics.httpRequests;
   }
 
   /**
@@ -477,22 +516,14 @@ export class PokerMCPServer extends EventEmitter {
     const now = Date.now();
     const maxAge = this.config.cacheTimeout!;
 
-    for (const [id, state] of this.gameStates.entries()) {
-      if (now - state.timestamp > maxAge) {
-        this.gameStates.delete(id);
+    // The ring already bounds the count; only expired states need clearing
+    for (let slot = 0; slot < this.gameStates.length; slot++) {
+      const state = this.gameStates[slot];
+      if (state && now - state.timestamp > maxAge) {
+        this.gameStates[slot] = undefined;
+        this.currentGameStateJson = null;
       }
     }
-
-    // Ensure we don't exceed max states
-    if (this.gameStates.size > this.config.maxGameStates!) {
-      const states = Array.from(this.gameStates.entries());
-      states.sort((a, b) => a[1].timestamp - b[1].timestamp);
-      
-      const toDelete = states.slice(0, states.length - this.config.maxGameStates!);
-      toDelete.forEach(([id]) => {
-        this.gameStates.delete(id);
-      });
-    }
   }
 
   /**
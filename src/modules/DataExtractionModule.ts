@@ -1,20 +1,30 @@
 // DataExtractionModule.ts
 // CoinPoker OCR and layout extraction for fast, robust GameState mapping
 
-import { createWorker, Worker } from 'tesseract.js';
+import type { Scheduler, Worker } from 'tesseract.js';
 import { GameState, ExtractionError, Player, Card, GamePhase } from '../shared/types/GameState';
 
+/** Character whitelist applied to the OCR worker in fast mode */
+const FAST_MODE_WHITELIST = '0123456789AJQKhdcsFOLDRAISECALLBETCHECKIN.-, ';
+
+/** Zone patterns, compiled once instead of on every frame */
+const PLAYERS_ZONE_PATTERN = /Players:\s*(.*?)(?=Community|$)/;
+const COMMUNITY_ZONE_PATTERN = /Community:\s*(.*?)(?=Pot|$)/;
+const POT_ZONE_PATTERN = /Pot:\s*(.*?)(?=Action|$)/;
+const ACTION_ZONE_PATTERN = /Action:\s*(.*?)(?=Players|$)/;
+
 /**
  * Options for DataExtractionModule
  */
 export interface DataExtractionOptions {
   lang?: string; // OCR language, default 'eng'
   fastMode?: boolean; // Use lower accuracy for speed
+  workerCount?: number; // OCR workers sharing recognition jobs, default 1 (larger pools are opt-in)
 }
 
 /**
  * Main DataExtractionModule class
- * - Integrates Tesseract.js WASM for OCR
+ * - Integrates Tesseract.js WASM for OCR, with a scheduler spreading frames across a worker pool
  * - Detects CoinPoker UI zones (player cards, community cards, pot, chips)
  * - Pattern matches card values, actions, numbers
  * - Corrects common OCR errors
@@ -23,51 +33,87 @@ export interface DataExtractionOptions {
  * - Optimized for <50ms extraction
  */
 export class DataExtractionModule {
-  private worker: Worker | null = null;
+  private scheduler: Scheduler | null = null;
+  private schedulerReady: Promise<void> | null = null;
   private lang: string;
   private fastMode: boolean;
+  private workerCount: number;
 
   constructor(options: DataExtractionOptions = {}) {
     this.lang = options.lang || 'eng';
     this.fastMode = options.fastMode ?? true;
+    this.workerCount = Math.max(1, options.workerCount ?? 1);
   }
 
   /**
-   * Initializes the Tesseract.js worker and loads language data.
+   * Initializes the Tesseract.js worker pool and loads language data.
    */
   async initWorker(): Promise<void> {
-    if (this.worker) {return;}
+    if (!this.schedulerReady) {
+      this.schedulerReady = this.startScheduler().catch((err) => {
+        this.schedulerReady = null;
+        throw err;
+      });
+    }
+    await this.schedulerReady;
+  }
+
+  /**
+   * Creates the scheduler and starts all workers in parallel.
+   */
+  private async startScheduler(): Promise<void> {
+    // Loaded on first use so importing the module doesn't pull in the OCR engine
+    const { createScheduler, createWorker } = await import('tesseract.js');
+    const scheduler = createScheduler();
+    const workers = await Promise.all(
+      Array.from({ length: this.workerCount }, () => this.createOcrWorker(createWorker))
+    );
+    workers.forEach((worker) => scheduler.addWorker(worker));
+    this.scheduler = scheduler;
+  }
+
+  /**
+   * Creates one Tesseract.js worker configured for this module.
+   */
+  private async createOcrWorker(
+    createWorker: typeof import('tesseract.js').createWorker
+  ): Promise<Worker> {
     // Await the worker creation (createWorker returns Promise<Worker>)
-    this.worker = await createWorker();
-    await this.worker.load();
+    const worker = await createWorker();
+    await worker.load();
     // @ts-expect-error: Tesseract.js types may be incomplete
-    await this.worker.loadLanguage(this.lang);
+    await worker.loadLanguage(this.lang);
     // @ts-expect-error: Tesseract.js types may be incomplete
-    await this.worker.initialize(this.lang);
+    await worker.initialize(this.lang);
     if (this.fastMode) {
-      await this.worker.setParameters({
-        tessedit_char_whitelist: '0123456789AJQKhdcsFOLDRAISECALLBETCHECKIN.-, ',
+      await worker.setParameters({
+        tessedit_char_whitelist: FAST_MODE_WHITELIST,
         preserve_interword_spaces: '1'
       });
     }
+    return worker;
   }
 
   /**
-   * Terminates the Tesseract.js worker.
+   * Terminates the Tesseract.js worker pool.
    */
   async terminateWorker(): Promise<void> {
-    if (this.worker) {
-      await this.worker.terminate();
-      this.worker = null;
+    if (this.schedulerReady) {
+      await this.schedulerReady.catch(() => undefined);
+    }
+    if (this.scheduler) {
+      await this.scheduler.terminate();
+      this.scheduler = null;
     }
+    this.schedulerReady = null;
   }
 
   /**
    * Main extraction entry point.
-   * @param image - Image data (HTMLImageElement, Canvas, or base64 string)
+   * @param image - Image data (HTMLImageElement, Canvas, encoded image Buffer, or base64 string)
    * @returns GameState and ExtractionErrors
    */
-  async extractGameState(image: HTMLImageElement | HTMLCanvasElement | string): Promise<{ gameState: GameState; errors: ExtractionError[] }> {
+  async extractGameState(image: HTMLImageElement | HTMLCanvasElement | Buffer | string): Promise<{ gameState: GameState; errors: ExtractionError[] }> {
     const start = performance.now();
     const errors: ExtractionError[] = [];
     let ocrResult: string = '';
@@ -75,7 +121,7 @@ export class DataExtractionModule {
     try {
       await this.initWorker();
       // Run OCR (assume image is compatible)
-      const { data } = await this.worker!.recognize(image);
+      const { data } = await this.scheduler!.addJob('recognize', image);
       ocrResult = data.text;
     } catch (err) {
       errors.push({
@@ -153,10 +199,10 @@ export class DataExtractionModule {
    * Detects UI zones in OCR text (stub: to be improved with layout heuristics).
    */
   private detectZones(ocrText: string): { playersZone: string; communityZone: string; potZone: string; actionZone: string } {
-    const playersZone = this.extractZone(ocrText, /Players:\s*(.*?)(?=Community|$)/);
-    const communityZone = this.extractZone(ocrText, /Community:\s*(.*?)(?=Pot|$)/);
-    const potZone = this.extractZone(ocrText, /Pot:\s*(.*?)(?=Action|$)/);
-    const actionZone = this.extractZone(ocrText, /Action:\s*(.*?)(?=Players|$)/);
+    const playersZone = this.extractZone(ocrText, PLAYERS_ZONE_PATTERN);
+    const communityZone = this.extractZone(ocrText, COMMUNITY_ZONE_PATTERN);
+    const potZone = this.extractZone(ocrText, POT_ZONE_PATTERN);
+    const actionZone = this.extractZone(ocrText, ACTION_ZONE_PATTERN);
     return {
       playersZone,
       communityZone,
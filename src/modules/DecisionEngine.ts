@@ -2,10 +2,11 @@
  * DecisionEngine: Poker LLM strategy engine with caching, timeout, and provider switching.
  * - Supports Gemini Pro and GPT-4 Turbo via provider abstraction.
  * - Uses LRU cache for fast recommendations and fallback.
+ * - Coalesces concurrent requests for the same state into a single LLM call.
  * - Handles timeouts, exponential backoff, and performance constraints.
  */
 
-import { GameState } from '../shared/types/GameState';
+import { Card, GameState } from '../shared/types/GameState';
 import {
   PokerAction,
   Recommendation,
@@ -24,11 +25,73 @@ interface DecisionEngineDependencies {
   gemini?: GeminiClient;
 }
 
+const cardKey = (card: Card): string => `${card.rank}${card.suit}`;
+
+const cardsKey = (cards: readonly Card[] | undefined): string =>
+  (cards ?? []).map(cardKey).sort().join('');
+
+/**
+ * Canonical cache key for a game state. Capture timestamps and extraction
+ * diagnostics are ignored and cards are sorted, so every frame showing the
+ * same table composition maps to the same key. Every other field reaches the
+ * prompt, so it is part of the key.
+ */
+export function stateCacheKey(gameState: GameState): string {
+  const players = gameState.players
+    .map((p) => {
+      const flags = `${p.isActive ? 1 : 0}${p.isDealer ? 1 : 0}${p.isHero ? 1 : 0}`;
+      const cards = cardsKey(p.cards);
+      return `${p.position}:${p.name ?? ''}:${p.chips}:${flags}:${cards}:${p.actions.join(',')}`;
+    })
+    .join('|');
+  return [
+    gameState.phase,
+    gameState.pot,
+    gameState.currentBet,
+    gameState.heroPosition,
+    gameState.lastAction ?? '',
+    cardsKey(gameState.communityCards),
+    players,
+    cardsKey(gameState.playerHand),
+    gameState.playerChips ?? '',
+    gameState.playerPosition ?? '',
+    gameState.startingChips ?? '',
+    gameState.multiWindowDetected ? 1 : 0,
+  ].join('/');
+}
+
+/**
+ * Stable key for a prompt context; stack sizes are sorted by player so key order does not matter.
+ */
+function contextKey(context: PromptContext): string {
+  const stacks = Object.keys(context.stackSizes)
+    .sort()
+    .map((player) => `${player}:${context.stackSizes[player]}`)
+    .join(',');
+  return `${context.potOdds}/${context.position}/${context.phase}/${stacks}`;
+}
+
+/** stateCacheKey results per state object; states are replaced between frames, not mutated */
+const stateKeys = new WeakMap<GameState, string>();
+
+/**
+ * stateCacheKey, computed once per state object however many lookups use it.
+ */
+function memoizedStateKey(gameState: GameState): string {
+  let key = stateKeys.get(gameState);
+  if (key === undefined) {
+    key = stateCacheKey(gameState);
+    stateKeys.set(gameState, key);
+  }
+  return key;
+}
+
 export class DecisionEngine {
   private config: DecisionEngineConfig;
   private cache: LRUCache<GameState, Recommendation>;
   private openAI?: OpenAIClient;
   private gemini?: GeminiClient;
+  private inFlight: Map<string, Promise<Recommendation | undefined>> = new Map();
 
   constructor(config: DecisionEngineConfig, deps?: DecisionEngineDependencies) {
     this.config = {
@@ -42,7 +105,7 @@ export class DecisionEngine {
     this.cache = new LRUCache<GameState, Recommendation>({
       maxSize: this.config.cacheSize!,
       ttlMs: this.config.cacheTTLms!,
-      hashFn: LRUCache.defaultObjectHash,
+      hashFn: memoizedStateKey,
     });
     this.openAI = deps?.openAI;
     this.gemini = deps?.gemini;
@@ -61,16 +124,26 @@ export class DecisionEngine {
     // Start timer for <80ms performance constraint
     const start = performance.now();
 
-    // Promise for LLM call with timeout
-    const llmPromise = this._withTimeout(
-      () => this._callLLM(gameState, context),
-      this.config.timeoutMs!
-    ).catch((err) => {
-      if (err === 'timeout') {
-        // Timeout occurred - LLM call will return undefined
-      }
-      return undefined;
-    });
+    // Share the LLM call with any request for the same prompt still in flight
+    const requestKey = `${memoizedStateKey(gameState)}#${contextKey(context)}`;
+    let llmPromise = this.inFlight.get(requestKey);
+    if (!llmPromise) {
+      // Promise for LLM call with timeout
+      llmPromise = this._withTimeout(
+        () => this._callLLM(gameState, context),
+        this.config.timeoutMs!
+      )
+        .catch((err) => {
+          if (err === 'timeout') {
+            // Timeout occurred - LLM call will return undefined
+          }
+          return undefined;
+        })
+        .finally(() => {
+          this.inFlight.delete(requestKey);
+        });
+      this.inFlight.set(requestKey, llmPromise);
+    }
 
     let rec: Recommendation | undefined = await llmPromise;
 
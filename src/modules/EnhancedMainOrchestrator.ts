@@ -8,9 +8,10 @@ import { OverlayUIModule } from './OverlayUIModule';
 import { SecurityManager } from './SecurityManager';
 import { ScreenshotManager, ScreenshotManagerConfig } from './ScreenshotManager';
 import { VisionModelService, VisionModelConfig } from '../services/vision/VisionModelService';
-import { GoogleADKWorkflow, WorkflowConfig } from '../services/agents/GoogleADKWorkflow';
+import type { GoogleADKWorkflow, WorkflowConfig } from '../services/agents/GoogleADKWorkflow';
+import { frameHash } from './utils/FrameHash';
+import { PromptEngineering } from './utils/PromptEngineering';
 import { Logger } from '../utils/logger';
-import { GameState } from '../shared/types/GameState';
 import { Recommendation } from '../shared/types/Decision';
 
 export interface EnhancedOrchestratorConfig extends OrchestratorConfig {
@@ -20,6 +21,9 @@ export interface EnhancedOrchestratorConfig extends OrchestratorConfig {
   useMultiAgentMode: boolean;
 }
 
+/** Number of processed frames between dropped-frame log lines */
+const FRAME_STATS_INTERVAL = 100;
+
 /**
  * Enhanced MainOrchestrator with screenshot management and multi-agent AI workflow
  */
@@ -37,9 +41,17 @@ export class EnhancedMainOrchestrator {
   };
   private errorRecovery: ErrorRecoveryStrategy;
   private running: boolean = false;
-  private screenshotManager?: ScreenshotManager;
-  private visionService?: VisionModelService;
-  private multiAgentWorkflow?: GoogleADKWorkflow;
+  // Declared with explicit initial values so every instance gets the same
+  // field layout up front instead of growing it during initialize()
+  private screenshotManager: ScreenshotManager | undefined = undefined;
+  private visionService: VisionModelService | undefined = undefined;
+  private multiAgentWorkflow: GoogleADKWorkflow | undefined = undefined;
+  private latestScreenshotId: string | null = null;
+  private lastProcessedScreenshotId: string | null = null;
+  private frameWaiter: (() => void) | null = null;
+  private processedFrames: number = 0;
+  private droppedFrames: number = 0;
+  private lastFrameHash: number | null = null;
 
   constructor(config: EnhancedOrchestratorConfig, errorRecovery: ErrorRecoveryStrategy) {
     this.config = config;
@@ -154,16 +166,10 @@ export class EnhancedMainOrchestrator {
         instance: this.visionService 
       };
 
-      // Initialize multi-agent workflow
-      this.multiAgentWorkflow = new GoogleADKWorkflow(
-        this.config.multiAgentWorkflow,
-        this.visionService,
-        logger
-      );
-      this.registry['multiAgentWorkflow'] = { 
-        status: ModuleStatus.Ready, 
-        instance: this.multiAgentWorkflow 
-      };
+      // Load the multi-agent workflow up front when it is enabled from the start
+      if (this.config.useMultiAgentMode) {
+        await this.loadMultiAgentWorkflow();
+      }
 
       // Set up event listeners
       this.setupEnhancedPipeline();
@@ -176,6 +182,7 @@ export class EnhancedMainOrchestrator {
       });
 
       this.running = true;
+      this.startEnhancedPipeline();
       logger.info('Enhanced MainOrchestrator initialized with AI capabilities');
     } catch (err) {
       const logger = this.registry['logger']?.instance as Logger;
@@ -191,34 +198,83 @@ export class EnhancedMainOrchestrator {
     const logger = this.registry['logger'].instance as Logger;
 
     // Listen for screenshot events
-    this.screenshotManager?.on('screenshot:captured', async (data) => {
+    this.screenshotManager?.on('screenshot:captured', (data) => {
       logger.debug(`New screenshot captured: ${data.id}`);
-      
-      if (this.config.useMultiAgentMode) {
-        // Process with multi-agent workflow
-        await this.processWithMultiAgent(data);
+      // A pending frame the loop has not picked up yet is superseded by this one
+      if (
+        this.latestScreenshotId !== null &&
+        this.latestScreenshotId !== this.lastProcessedScreenshotId
+      ) {
+        this.droppedFrames += 1;
       }
+      this.latestScreenshotId = data.id;
+      // The processing loop runs the multi-agent workflow or the OCR pipeline for this frame
+      this.signalFrameReady();
     });
 
     this.screenshotManager?.on('screenshot:error', (error) => {
       logger.error('Screenshot capture error', error);
     });
+  }
 
-    // Listen for multi-agent workflow events
-    this.multiAgentWorkflow?.on('agent:start', (data) => {
-      logger.debug(`Agent started: ${data.agentId} (${data.role})`);
-    });
+  /**
+   * Multi-agent workflow, imported and created on first use: single-model mode never
+   * loads it, and enabling multi-agent mode through updateConfig takes effect.
+   */
+  private async loadMultiAgentWorkflow(): Promise<GoogleADKWorkflow> {
+    if (this.multiAgentWorkflow) {
+      return this.multiAgentWorkflow;
+    }
+    const logger = this.registry['logger'].instance as Logger;
+    const { GoogleADKWorkflow } = await import('../services/agents/GoogleADKWorkflow');
+    if (!this.multiAgentWorkflow) {
+      const workflow = new GoogleADKWorkflow(
+        this.config.multiAgentWorkflow,
+        this.visionService!,
+        logger
+      );
 
-    this.multiAgentWorkflow?.on('agent:complete', (data) => {
-      logger.debug(`Agent completed: ${data.agentId} with confidence ${data.confidence}`);
-    });
+      // Listen for multi-agent workflow events
+      workflow.on('agent:start', (data) => {
+        logger.debug(`Agent started: ${data.agentId} (${data.role})`);
+      });
 
-    this.multiAgentWorkflow?.on('workflow:complete', (result) => {
-      logger.info(`Workflow complete: ${result.recommendation} (${result.confidence})`);
+      workflow.on('agent:complete', (data) => {
+        logger.debug(`Agent completed: ${data.agentId} with confidence ${data.confidence}`);
+      });
+
+      workflow.on('workflow:complete', (result) => {
+        logger.info(`Workflow complete: ${result.recommendation} (${result.confidence})`);
+      });
+
+      this.multiAgentWorkflow = workflow;
+      this.registry['multiAgentWorkflow'] = {
+        status: ModuleStatus.Ready,
+        instance: workflow,
+      };
+    }
+    return this.multiAgentWorkflow;
+  }
+
+  /**
+   * Resolve once a screenshot newer than the last processed one is available
+   */
+  private waitForFrame(): Promise<void> {
+    if (!this.running || this.latestScreenshotId !== this.lastProcessedScreenshotId) {
+      return Promise.resolve();
+    }
+    return new Promise((resolve) => {
+      this.frameWaiter = resolve;
     });
+  }
 
-    // Start traditional pipeline with enhancements
-    this.startEnhancedPipeline();
+  /**
+   * Wake the pipeline loop if it is waiting for a frame
+   */
+  private signalFrameReady() {
+    const wake = this.frameWaiter;
+    this.frameWaiter = null;
+    wake?.();
   }
 
   /**
@@ -231,103 +287,96 @@ export class EnhancedMainOrchestrator {
     const overlayUI = this.registry['overlayUI'].instance as OverlayUIModule;
     const logger = this.registry['logger'].instance as Logger;
 
-    const poll = async () => {
+    const run = async () => {
       while (this.running) {
+        // Block until the screenshot manager delivers a new frame instead of polling
+        await this.waitForFrame();
+        const screenshotId = this.latestScreenshotId;
+        if (
+          !this.running ||
+          screenshotId === null ||
+          screenshotId === this.lastProcessedScreenshotId
+        ) {
+          continue;
+        }
+        this.lastProcessedScreenshotId = screenshotId;
+
         const start = performance.now();
         try {
-          // Get recent screenshots for context
-          const recentScreenshots = this.screenshotManager?.getRecentScreenshots(5) || [];
-          
-          if (recentScreenshots.length > 0) {
-            const latestScreenshot = recentScreenshots[0];
-            const screenshotData = await this.screenshotManager?.getScreenshotData(latestScreenshot.id);
-            
-            if (screenshotData) {
-              let decision: Recommendation;
-              let gameState: GameState;
-
-              if (this.config.useMultiAgentMode && this.multiAgentWorkflow) {
-                // Use multi-agent workflow
-                gameState = await (gameStateManager as any).getState();
-                const workflowResult = await this.multiAgentWorkflow.processPokerScreenshot(
-                  screenshotData,
-                  gameState
+          const screenshotData = await this.screenshotManager?.getScreenshotData(screenshotId);
+
+          // Skip the pipeline when the table looks exactly like the last frame
+          const hash = screenshotData ? frameHash(screenshotData) : null;
+          if (screenshotData && hash !== this.lastFrameHash) {
+            const workflow = this.config.useMultiAgentMode
+              ? await this.loadMultiAgentWorkflow()
+              : null;
+            // OCR feeds the state manager; it is not awaited before the workflow starts
+            const extraction = dataExtraction
+              .extractGameState(screenshotData)
+              .then(({ gameState }) => {
+                gameStateManager.updateState(gameState);
+                return gameState;
+              });
+            let decision: Recommendation | null = null;
+
+            if (workflow) {
+              // The vision agent reads this frame itself and gets the last accepted state
+              // for context, so OCR only delays the workflow while no state exists yet
+              const knownState = gameStateManager.getState() ?? (await extraction);
+              const [workflowResult] = await Promise.all([
+                workflow.processPokerScreenshot(screenshotData, knownState),
+                extraction,
+              ]);
+
+              decision = {
+                action: workflowResult.recommendation as any,
+                confidence: workflowResult.confidence,
+                rationale: workflowResult.reasoning,
+                timestamp: Date.now(),
+              };
+            } else {
+              const gameState = await extraction;
+              // The state manager only keeps states that pass validation
+              if (gameStateManager.getState() === gameState) {
+                decision = await decisionEngine.getRecommendation(
+                  gameState,
+                  PromptEngineering.buildContext(gameState)
                 );
-                
-                decision = {
-                  action: workflowResult.recommendation as any,
-                  confidence: workflowResult.confidence,
-                  rationale: workflowResult.reasoning,
-                  timestamp: Date.now(),
-                };
-              } else {
-                // Traditional pipeline with vision enhancement
-                const visionAnalysis = await this.visionService?.analyzePokerTable(screenshotData);
-                
-                // Merge vision analysis with OCR extraction
-                const extracted = await (dataExtraction as any).extract({
-                  image: screenshotData,
-                  visionHints: visionAnalysis?.analysis,
-                });
-                
-                gameState = await (gameStateManager as any).updateState(extracted);
-                decision = await (decisionEngine as any).decide(gameState);
               }
+            }
+
+            // Handled, even without a decision: a repeat of this screenshot is skipped.
+            // A thrown error skips this line, so the next identical screenshot is retried.
+            this.lastFrameHash = hash;
 
-              // Display decision
-              await (overlayUI as any).display(decision);
+            if (decision) {
+              overlayUI.setRecommendation(decision);
 
               // Performance monitoring
               const latency = performance.now() - start;
               this.updateMetrics(latency);
-              
+
               if (latency > this.config.maxPipelineLatencyMs) {
                 logger.warn(`Pipeline latency exceeded: ${latency}ms`);
               }
+
+              this.processedFrames += 1;
+              if (this.processedFrames % FRAME_STATS_INTERVAL === 0) {
+                logger.debug(
+                  `Processed ${this.processedFrames} frames, dropped ${this.droppedFrames} stale frames`
+                );
+              }
             }
           }
         } catch (err) {
           logger.error('Enhanced pipeline error', err);
           this.handleModuleFailure('pipeline', err instanceof Error ? err : new Error(String(err)));
         }
-
-        // Rate limiting
-        await new Promise((resolve) => setTimeout(resolve, 100));
       }
     };
 
-    poll();
-  }
-
-  /**
-   * Process screenshot with multi-agent workflow
-   */
-  private async processWithMultiAgent(screenshotData: any) {
-    const gameStateManager = this.registry['gameStateManager'].instance as GameStateManager;
-    const overlayUI = this.registry['overlayUI'].instance as OverlayUIModule;
-    const logger = this.registry['logger'].instance as Logger;
-
-    try {
-      const imageData = await this.screenshotManager?.getScreenshotData(screenshotData.id);
-      if (!imageData) {return;}
-
-      const gameState = await (gameStateManager as any).getState();
-      const result = await this.multiAgentWorkflow?.processPokerScreenshot(imageData, gameState);
-
-      if (result) {
-        const decision: any = {
-          action: result.recommendation,
-          confidence: result.confidence,
-          reasoning: result.reasoning,
-          timestamp: Date.now(),
-        };
-
-        await (overlayUI as any).display(decision);
-        logger.info(`AI recommendation: ${decision.action} (${decision.confidence})`);
-      }
-    } catch (error) {
-      logger.error('Multi-agent processing failed', error);
-    }
+    run();
   }
 
   /**
@@ -338,8 +387,8 @@ export class EnhancedMainOrchestrator {
     this.metrics.maxObservedLatencyMs = Math.max(this.metrics.maxObservedLatencyMs, latency);
     this.metrics.minObservedLatencyMs = Math.min(this.metrics.minObservedLatencyMs, latency);
     this.metrics.runCount += 1;
-    this.metrics.averageLatencyMs =
-      ((this.metrics.averageLatencyMs * (this.metrics.runCount - 1)) + latency) / this.metrics.runCount;
+    this.metrics.averageLatencyMs +=
+      (latency - this.metrics.averageLatencyMs) / this.metrics.runCount;
     this.metrics.timestamp = Date.now();
   }
 
@@ -378,6 +427,7 @@ export class EnhancedMainOrchestrator {
    */
   public async shutdown() {
     this.running = false;
+    this.signalFrameReady();
     await this.screenshotManager?.stop();
     await this.injector.shutdownAll();
     
@@ -409,10 +459,10 @@ export class EnhancedMainOrchestrator {
   }
 
   /**
-   * Get metrics
+   * Get metrics: a live read-only view, updated every frame. Spread it to keep a snapshot.
    */
-  public getMetrics(): PipelineMetrics {
-    return { ...this.metrics };
+  public getMetrics(): Readonly<PipelineMetrics> {
+    return this.metrics;
   }
 
   /**
@@ -430,6 +480,8 @@ export class EnhancedMainOrchestrator {
       count: this.screenshotManager?.getScreenshotCount() || 0,
       oldest: this.screenshotManager?.getOldestTimestamp() || null,
       newest: this.screenshotManager?.getNewestTimestamp() || null,
+      processed: this.processedFrames,
+      dropped: this.droppedFrames,
     };
   }
 }
@@ -7,8 +7,14 @@ import { DecisionEngine } from './DecisionEngine';
 import { OverlayUIModule } from './OverlayUIModule';
 import { SecurityManager } from './SecurityManager';
 import { Logger } from '../utils/logger';
+import { ScreenCapture } from '../shared/types/ScreenCapture';
+import { frameHash } from './utils/FrameHash';
+import { PromptEngineering } from './utils/PromptEngineering';
 // Use performance.now() directly for timing
 
+/** Pause before polling again after a failed pipeline run */
+const PIPELINE_RETRY_DELAY_MS = 10;
+
 /**
  * MainOrchestrator coordinates all modules, manages the data pipeline,
  * enforces latency, handles errors, and manages configuration and shutdown.
@@ -101,15 +107,14 @@ export class MainOrchestrator {
       this.registry['overlayUI'] = { status: ModuleStatus.Initializing, instance: this.injector.resolve('overlayUI') };
       this.registry['securityManager'] = { status: ModuleStatus.Initializing, instance: this.injector.resolve('securityManager') };
 
-      // Set up event listeners for pipeline flow
-      this.setupPipelineEvents();
-
       // Mark all as ready
       Object.keys(this.registry).forEach((name) => {
         this.registry[name].status = ModuleStatus.Ready;
       });
 
       this.running = true;
+      // Start the pipeline loop once the orchestrator is marked running
+      this.setupPipelineEvents();
       (this.registry['logger'].instance as Logger).info('MainOrchestrator initialized.');
     } catch (err) {
       (this.registry['logger']?.instance as Logger)?.error('Initialization failed', err);
@@ -119,7 +124,9 @@ export class MainOrchestrator {
 
   /**
    * Set up the polling pipeline: capture → extract → manage state → decide → display.
-   * This replaces event-driven wiring with a polling loop.
+   * This replaces event-driven wiring with a polling loop. The next frame is
+   * captured while the current one is being analyzed, so a run costs
+   * max(capture, analysis) rather than their sum.
    */
   private setupPipelineEvents() {
     const screenCapture = this.registry['screenCapture'].instance as ScreenCaptureModule;
@@ -131,32 +138,65 @@ export class MainOrchestrator {
 
     // Start polling loop for the pipeline
     const poll = async () => {
+      let nextFrame: Promise<ScreenCapture> | null = null;
+      let lastFrameHash: number | null = null;
       while (this.running) {
         const start = performance.now();
         try {
-          // Capture a frame (single image)
-          const frame = await screenCapture.captureScreen();
-          // Extract data from frame
-          const extracted = await (dataExtraction as any).extract(frame);
-          // Update game state
-          const state = await (gameStateManager as any).updateState(extracted);
-          // Make decision
-          const decision = await (decisionEngine as any).decide(state);
-          // Display overlay
-          await (overlayUI as any).display(decision);
-
-          // Performance monitoring
-          const latency = performance.now() - start;
-          this.updateMetrics(latency);
-          if (latency > this.config.maxPipelineLatencyMs) {
-            logger.warn(`Pipeline latency exceeded: ${latency}ms`);
+          // Take the prefetched frame, or capture one if nothing is in flight
+          const pending: Promise<ScreenCapture> = nextFrame ?? screenCapture.captureScreen();
+          nextFrame = null;
+          const frame = await pending;
+          // Prefetch the next frame while this one moves through the pipeline; a capture
+          // failure is surfaced when it is awaited on the next run. None once shut down.
+          if (this.running) {
+            nextFrame = screenCapture.captureScreen();
+            nextFrame.catch(() => undefined);
+          }
+          // Skip extraction and decision when the table has not changed
+          const hash = frameHash(frame.image);
+          if (hash !== lastFrameHash) {
+            // Extract data from frame (a Buffer view over the capture, not a copy)
+            const image = frame.image;
+            const { gameState } = await dataExtraction.extractGameState(
+              Buffer.isBuffer(image)
+                ? image
+                : Buffer.from(image.buffer, image.byteOffset, image.byteLength)
+            );
+            // Update game state; the manager only keeps states that pass validation
+            gameStateManager.updateState(gameState);
+            if (gameStateManager.getState() === gameState) {
+              // Make decision
+              const decision = await decisionEngine.getRecommendation(
+                gameState,
+                PromptEngineering.buildContext(gameState)
+              );
+              // Display overlay
+              overlayUI.setRecommendation(decision);
+
+              // Performance monitoring
+              const latency = performance.now() - start;
+              this.updateMetrics(latency);
+              if (latency > this.config.maxPipelineLatencyMs) {
+                logger.warn(`Pipeline latency exceeded: ${latency}ms`);
+              }
+            }
+            // Polled captures of a table OCR cannot read are skipped too, until it changes;
+            // only a run that throws leaves the hash unset so the next poll retries it
+            lastFrameHash = hash;
           }
         } catch (err) {
           logger.error('Pipeline error', err);
           this.handleModuleFailure('pipeline', err instanceof Error ? err : new Error(String(err)));
+          // Captures pace the loop; after a failure, pause so a persistent error cannot spin it
+          await new Promise((resolve) => setTimeout(resolve, PIPELINE_RETRY_DELAY_MS));
         }
-        // Optionally, add a small delay to avoid 100% CPU usage
-        await new Promise((resolve) => setTimeout(resolve, 10));
+      }
+      // Shutdown during analysis can leave one prefetch in flight; log its failure, if any
+      if (nextFrame) {
+        await nextFrame.catch((err) =>
+          logger.error('Prefetched capture failed after shutdown', err)
+        );
       }
     };
 
@@ -172,8 +212,8 @@ export class MainOrchestrator {
     this.metrics.maxObservedLatencyMs = Math.max(this.metrics.maxObservedLatencyMs, latency);
     this.metrics.minObservedLatencyMs = Math.min(this.metrics.minObservedLatencyMs, latency);
     this.metrics.runCount += 1;
-    this.metrics.averageLatencyMs =
-      ((this.metrics.averageLatencyMs * (this.metrics.runCount - 1)) + latency) / this.metrics.runCount;
+    this.metrics.averageLatencyMs +=
+      (latency - this.metrics.averageLatencyMs) / this.metrics.runCount;
     this.metrics.timestamp = Date.now();
   }
 
@@ -233,10 +273,11 @@ export class MainOrchestrator {
   }
 
   /**
-   * Expose current metrics for monitoring.
+   * Expose current metrics for monitoring: a live read-only view, updated every frame.
+   * Spread it to keep a snapshot.
    */
-  public getMetrics(): PipelineMetrics {
-    return { ...this.metrics };
+  public getMetrics(): Readonly<PipelineMetrics> {
+    return this.metrics;
   }
 
   /**
@@ -3,11 +3,16 @@ import { OverlayConfiguration, OverlayPosition, DisplaySettings } from '../share
 /**
  * OverlayUIModule manages the overlay window UI, state, and communication with the Electron renderer process.
  * Handles dynamic positioning, transparency, element visibility, and performance-optimized updates.
+ * Changes made within one task are coalesced into one IPC message per channel and a single render.
  */
 export class OverlayUIModule {
   private config: OverlayConfiguration;
   private recommendation: any; // Replace with actual recommendation type
   private updateCallback: (() => void) | null = null;
+  private sendScheduled = false;
+  private frameScheduled = false;
+  private configDirty = false;
+  private recommendationDirty = false;
 
   /**
    * Initializes the OverlayUIModule with a configuration.
@@ -32,8 +37,7 @@ export class OverlayUIModule {
    */
   public setConfiguration(config: OverlayConfiguration) {
     this.config = config;
-    this.triggerUpdate();
-    this.sendConfigToRenderer();
+    this.markConfigDirty();
   }
 
   /**
@@ -49,8 +53,8 @@ export class OverlayUIModule {
    */
   public setRecommendation(recommendation: any) {
     this.recommendation = recommendation;
-    this.triggerUpdate();
-    this.sendRecommendationToRenderer();
+    this.recommendationDirty = true;
+    this.scheduleSend();
   }
 
   /**
@@ -66,8 +70,7 @@ export class OverlayUIModule {
    */
   public setPosition(position: OverlayPosition) {
     this.config.position = position;
-    this.triggerUpdate();
-    this.sendConfigToRenderer();
+    this.markConfigDirty();
   }
 
   /**
@@ -76,8 +79,7 @@ export class OverlayUIModule {
    */
   public setTransparency(transparency: number) {
     this.config.transparency = Math.max(0, Math.min(100, transparency));
-    this.triggerUpdate();
-    this.sendConfigToRenderer();
+    this.markConfigDirty();
   }
 
   /**
@@ -86,20 +88,63 @@ export class OverlayUIModule {
    */
   public setDisplaySettings(display: DisplaySettings) {
     this.config.display = display;
-    this.triggerUpdate();
-    this.sendConfigToRenderer();
+    this.markConfigDirty();
   }
 
   /**
-   * Triggers the registered update callback for React state sync.
+   * Marks the configuration as changed and schedules a send.
+   */
+  private markConfigDirty() {
+    this.configDirty = true;
+    this.scheduleSend();
+  }
+
+  /**
+   * Schedules one IPC flush for all changes made in the current task. A microtask
+   * rather than an animation frame, so delivery is not paused for hidden windows.
+   */
+  private scheduleSend() {
+    if (this.sendScheduled) {
+      return;
+    }
+    this.sendScheduled = true;
+    queueMicrotask(() => this.flushChanges());
+  }
+
+  /**
+   * Sends each changed piece of state once and schedules a single UI update.
+   */
+  private flushChanges() {
+    this.sendScheduled = false;
+    if (this.configDirty) {
+      this.configDirty = false;
+      this.sendConfigToRenderer();
+    }
+    if (this.recommendationDirty) {
+      this.recommendationDirty = false;
+      this.sendRecommendationToRenderer();
+    }
+    this.scheduleFrame();
+  }
+
+  /**
+   * Schedules at most one animation frame for the update callback.
    * Ensures UI updates are batched for <10ms latency.
    */
-  private triggerUpdate() {
-    if (this.updateCallback) {
-      // Use requestAnimationFrame for fast, batched UI updates
-      window.requestAnimationFrame(() => {
-        this.updateCallback && this.updateCallback();
-      });
+  private scheduleFrame() {
+    if (this.frameScheduled || !this.updateCallback) {
+      return;
+    }
+    this.frameScheduled = true;
+    const render = () => {
+      this.frameScheduled = false;
+      this.updateCallback && this.updateCallback();
+    };
+    // Outside a renderer there are no animation frames; run on the next task instead
+    if (typeof window !== 'undefined' && typeof window.requestAnimationFrame === 'function') {
+      window.requestAnimationFrame(render);
+    } else {
+      setTimeout(render, 0);
     }
   }
 
@@ -107,7 +152,7 @@ export class OverlayUIModule {
    * Sends the current configuration to the Electron renderer process via IPC.
    */
   private sendConfigToRenderer() {
-    if ((window as any).electron && (window as any).electron.ipcRenderer) {
+    if (typeof window !== 'undefined' && (window as any).electron?.ipcRenderer) {
       (window as any).electron.ipcRenderer.send('overlay-config', this.config);
     }
   }
@@ -116,7 +161,7 @@ export class OverlayUIModule {
    * Sends the current recommendation to the Electron renderer process via IPC.
    */
   private sendRecommendationToRenderer() {
-    if ((window as any).electron && (window as any).electron.ipcRenderer) {
+    if (typeof window !== 'undefined' && (window as any).electron?.ipcRenderer) {
       (window as any).electron.ipcRenderer.send('overlay-recommendation', this.recommendation);
     }
   }
@@ -48,20 +48,74 @@ function adaptResolution(
  */
 export class ScreenCaptureModule {
   private config: CaptureConfig;
+  /** Video element and canvas reused across captures, created on first use */
+  private video: HTMLVideoElement | null = null;
+  private canvas: HTMLCanvasElement | null = null;
+  private ctx: CanvasRenderingContext2D | null = null;
+  /** Settles when the last queued capture finishes; captures share the elements above */
+  private pendingCapture: Promise<unknown> = Promise.resolve();
+  /** Validated capture resolution by requested "WxH", resolved once per size */
+  private resolvedResolutions: Map<string, { width: number; height: number }> = new Map();
 
   constructor(config: CaptureConfig) {
     this.config = config;
   }
 
+  /**
+   * Validates a requested resolution against the supported list, adapting it to the
+   * closest supported one. Results are memoized since captures repeat the same size.
+   */
+  private resolveResolution(
+    requested: { width: number; height: number } | undefined
+  ): { width: number; height: number } {
+    const supported = this.config.supportedResolutions;
+    const resolution =
+      requested || (supported.length > 0 ? supported[0] : { width: 1920, height: 1080 });
+    const key = `${resolution.width}x${resolution.height}`;
+    const cached = this.resolvedResolutions.get(key);
+    if (cached) {
+      return cached;
+    }
+
+    let resolved = resolution;
+    if (!isSupportedResolution(resolution, supported)) {
+      // Try to adapt
+      const adapted = adaptResolution(resolution, supported);
+      if (!isSupportedResolution(adapted, supported)) {
+        throw new UnsupportedResolutionError('Requested resolution is not supported', resolution);
+      }
+      resolved = adapted;
+    }
+    this.resolvedResolutions.set(key, resolved);
+    return resolved;
+  }
+
+  /**
+   * Returns the reusable capture canvas, sized to the given resolution. The canvas is
+   * only resized when the resolution changes, since resizing clears it.
+   */
+  private getCanvas(resolution: { width: number; height: number }): HTMLCanvasElement {
+    if (!this.canvas) {
+      this.canvas = document.createElement('canvas');
+    }
+    const canvas = this.canvas;
+    if (canvas.width !== resolution.width || canvas.height !== resolution.height) {
+      canvas.width = resolution.width;
+      canvas.height = resolution.height;
+    }
+    return canvas;
+  }
+
   /**
    * Prompts the user to select a window or screen to capture.
    * Returns the selected DesktopCapturerSource.
    */
   async selectTargetWindow(): Promise<DesktopCapturerSource> {
+    // Sources are matched by name and id only, so skip rendering thumbnails and icons
     const sources = await desktopCapturer.getSources({
       types: ['window', 'screen'],
-      fetchWindowIcons: true,
-      thumbnailSize: { width: 400, height: 400 },
+      fetchWindowIcons: false,
+      thumbnailSize: { width: 0, height: 0 },
     });
 
     // If a target window title is specified, try to match it
@@ -84,31 +138,25 @@ export class ScreenCaptureModule {
   /**
    * Captures the screen or window at the specified resolution.
    * Throws on unsupported resolution or permission denial.
+   * Overlapping calls are queued: each capture holds the shared video element and
+   * canvas across several awaits, so they run one at a time.
+   */
+  captureScreen(requestedResolution?: { width: number; height: number }): Promise<ScreenCapture> {
+    const capture = this.pendingCapture.then(() => this.captureFrame(requestedResolution));
+    this.pendingCapture = capture.catch(() => undefined);
+    return capture;
+  }
+
+  /**
+   * Captures a single frame; callers go through captureScreen so captures never overlap.
    */
-  async captureScreen(
+  private async captureFrame(
     requestedResolution?: { width: number; height: number }
   ): Promise<ScreenCapture> {
     const start = performance.now();
-    const config = this.config;
-    const supported = config.supportedResolutions;
 
-    // Get current or requested resolution
-    let resolution =
-      requestedResolution ||
-      (supported.length > 0 ? supported[0] : { width: 1920, height: 1080 });
-
-    // Validate resolution
-    if (!isSupportedResolution(resolution, supported)) {
-      // Try to adapt
-      const adapted = adaptResolution(resolution, supported);
-      if (!isSupportedResolution(adapted, supported)) {
-        throw new UnsupportedResolutionError(
-          'Requested resolution is not supported',
-          resolution
-        );
-      }
-      resolution = adapted;
-    }
+    // Get current or requested resolution, validated against the supported list
+    const resolution = this.resolveResolution(requestedResolution);
 
     // Select target window/screen
     let source: DesktopCapturerSource;
@@ -144,7 +192,10 @@ export class ScreenCaptureModule {
     }
 
     // Capture a single frame from the stream
-    const video = document.createElement('video');
+    if (!this.video) {
+      this.video = document.createElement('video');
+    }
+    const video = this.video;
     video.srcObject = stream;
     video.width = resolution.width;
     video.height = resolution.height;
@@ -155,12 +206,14 @@ export class ScreenCaptureModule {
     });
 
     // Draw video frame to canvas
-    const canvas = document.createElement('canvas');
-    canvas.width = resolution.width;
-    canvas.height = resolution.height;
-    const ctx = canvas.getContext('2d');
+    const canvas = this.getCanvas(resolution);
+    if (!this.ctx) {
+      this.ctx = canvas.getContext('2d');
+    }
+    const ctx = this.ctx;
     if (!ctx) {
       stream.getTracks().forEach((t) => t.stop());
+      video.srcObject = null;
       throw new CaptureFailureError('Failed to get canvas context');
     }
     ctx.drawImage(video, 0, 0, resolution.width, resolution.height);
@@ -172,8 +225,9 @@ export class ScreenCaptureModule {
     const arrayBuffer = await blob.arrayBuffer();
     const image = new Uint8Array(arrayBuffer);
 
-    // Clean up
+    // Clean up; the video element is kept for the next capture
     stream.getTracks().forEach((t) => t.stop());
+    video.srcObject = null;
 
     // Performance check
     const elapsed = performance.now() - start;
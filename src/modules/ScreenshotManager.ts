@@ -2,6 +2,7 @@ import { EventEmitter } from 'events';
 import { ScreenCaptureModule } from './ScreenCaptureModule';
 import { ScreenCapture } from '../shared/types/ScreenCapture';
 import { Logger } from '../utils/logger';
+import { createId } from '../utils/id';
 import * as fs from 'fs/promises';
 import * as path from 'path';
 
@@ -22,14 +23,19 @@ export interface StoredScreenshot {
   };
 }
 
+/** Number of most recent frames kept in memory for the pipeline */
+const FRAME_RING_SIZE = 3;
+
 export class ScreenshotManager extends EventEmitter {
   private config: ScreenshotManagerConfig;
   private captureModule: ScreenCaptureModule;
   private logger: Logger;
-  private captureInterval?: NodeJS.Timeout;
+  private captureTimer?: NodeJS.Timeout | undefined;
   private cleanupInterval?: NodeJS.Timeout;
   private screenshots: Map<string, StoredScreenshot> = new Map();
   private isRunning: boolean = false;
+  private frameRing: Array<{ id: string; image: Buffer } | undefined> = new Array(FRAME_RING_SIZE);
+  private frameRingIndex: number = 0;
 
   constructor(
     config: ScreenshotManagerConfig,
@@ -65,26 +71,21 @@ export class ScreenshotManager extends EventEmitter {
     this.isRunning = true;
     this.logger.info('Starting screenshot capture system');
 
-    // Start capture interval (1 second)
-    this.captureInterval = setInterval(async () => {
-      await this.captureScreenshot();
-    }, this.config.captureIntervalMs);
-
     // Start cleanup interval (check every minute)
     this.cleanupInterval = setInterval(async () => {
       await this.cleanupOldScreenshots();
     }, 60000);
 
-    // Initial capture
-    await this.captureScreenshot();
+    // Initial capture; each cycle schedules the next one
+    await this.runCaptureCycle();
   }
 
   public async stop(): Promise<void> {
     this.isRunning = false;
     
-    if (this.captureInterval) {
-      clearInterval(this.captureInterval);
-      this.captureInterval = undefined as any;
+    if (this.captureTimer) {
+      clearTimeout(this.captureTimer);
+      this.captureTimer = undefined;
     }
 
     if (this.cleanupInterval) {
@@ -95,6 +96,22 @@ export class ScreenshotManager extends EventEmitter {
     this.logger.info('Stopped screenshot capture system');
   }
 
+  /**
+   * Capture one screenshot, then schedule the next for the rest of the interval.
+   * Unlike setInterval, a slow capture can never overlap the following one.
+   */
+  private async runCaptureCycle(): Promise<void> {
+    const cycleStart = performance.now();
+    await this.captureScreenshot();
+
+    if (!this.isRunning) {return;}
+    const elapsed = performance.now() - cycleStart;
+    const delay = Math.max(0, this.config.captureIntervalMs - elapsed);
+    this.captureTimer = setTimeout(() => {
+      void this.runCaptureCycle();
+    }, delay);
+  }
+
   private async captureScreenshot(): Promise<void> {
     try {
       const startTime = performance.now();
@@ -103,7 +120,7 @@ export class ScreenshotManager extends EventEmitter {
       const capture: ScreenCapture = await this.captureModule.captureScreen();
       
       // Generate unique ID and filename
-      const id = `screenshot_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+      const id = createId('screenshot', capture.timestamp);
       const filename = `${id}.png`;
       const filepath = path.join(this.config.storageDirectory, filename);
 
@@ -123,6 +140,15 @@ export class ScreenshotManager extends EventEmitter {
 
       this.screenshots.set(id, screenshot);
 
+      // Keep the frame in memory so consumers don't read it back from disk;
+      // the Buffer is a view over the capture bytes, not a copy
+      const { buffer, byteOffset, byteLength } = capture.image;
+      this.frameRing[this.frameRingIndex] = {
+        id,
+        image: Buffer.from(buffer, byteOffset, byteLength),
+      };
+      this.frameRingIndex = (this.frameRingIndex + 1) % FRAME_RING_SIZE;
+
       // Emit event for other modules
       this.emit('screenshot:captured', {
         id,
@@ -256,6 +282,11 @@ export class ScreenshotManager extends EventEmitter {
   }
 
   public async getScreenshotData(id: string): Promise<Buffer | null> {
+    // Recent frames are served from memory
+    for (const frame of this.frameRing) {
+      if (frame && frame.id === id) {return frame.image;}
+    }
+
     const screenshot = this.screenshots.get(id);
     if (!screenshot) {return null;}
 
@@ -0,0 +1,263 @@
+/**
+ * Monte Carlo equity estimation for Texas Hold'em.
+ * Deals random opponent hands and board runouts in batches, scores every opponent hand
+ * of a batch with a single evaluateBatch call and tabulates hero wins and split pots.
+ */
+
+import { Card } from '../../shared/types/GameState';
+import { DECK_CODES, encodeCard, evaluateBatch, evaluateCodes } from './HandEvaluator';
+import { LRUCache } from './LRUCache';
+
+export interface EquityResult {
+  win: number; // Fraction of runouts hero wins outright
+  tie: number; // Fraction of runouts hero splits
+  equity: number; // Wins plus hero's share of split pots
+  samples: number;
+}
+
+export interface EquityCalculatorOptions {
+  samples?: number; // Runouts per estimate, default 5000
+  seed?: number; // Seeds a private generator for reproducible estimates
+  random?: () => number; // Uniform [0, 1) source, overrides seed; default Math.random
+  cacheSize?: number; // Estimates kept for repeated queries, default 128
+}
+
+/** Runouts scored per evaluateBatch call */
+const BATCH_SIZE = 256;
+
+/** Number of distinct addresses for drawing 0, 1 or 2 cards from 52 */
+const DRAW_ADDRESSES: readonly number[] = [1, 52, (52 * 51) / 2];
+
+/**
+ * Combinatorial address of the first `count` (at most two) card indices in `deck`,
+ * independent of their order.
+ */
+function drawAddress(deck: readonly number[], count: number): number {
+  if (count === 0) {
+    return 0;
+  }
+  if (count === 1) {
+    return deck[0];
+  }
+  const high = Math.max(deck[0], deck[1]);
+  return (high * (high - 1)) / 2 + Math.min(deck[0], deck[1]);
+}
+
+/**
+ * Index of an evaluator card code in DECK_CODES (rank index * 4 + suit index).
+ */
+function deckIndex(code: number): number {
+  return ((code >> 8) & 0xf) * 4 + (31 - Math.clz32((code >> 12) & 0xf));
+}
+
+/**
+ * Mulberry32: a small, fast 32-bit generator giving each calculator its own
+ * reproducible stream.
+ */
+function seededRandom(seed: number): () => number {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = Math.imul(state ^ (state >>> 15), state | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 2 ** 32;
+  };
+}
+
+/**
+ * Index (0-168) of a two-card starting hand class: pairs on the diagonal, suited hands
+ * above it and offsuit hands below it, so suit-isomorphic hands share an index.
+ */
+function startingHandClass(c0: number, c1: number): number {
+  const r0 = (c0 >> 8) & 0xf;
+  const r1 = (c1 >> 8) & 0xf;
+  const high = Math.max(r0, r1);
+  const low = Math.min(r0, r1);
+  return c0 & c1 & 0xf000 ? high * 13 + low : low * 13 + high;
+}
+
+/**
+ * Order-independent cache key for an equity query.
+ */
+function equityCacheKey(hole: number[], board: number[], opponents: number): string {
+  const byCode = (a: number, b: number) => a - b;
+  return `${[...hole].sort(byCode)}|${[...board].sort(byCode)}|${opponents}`;
+}
+
+export class EquityCalculator {
+  private static instance: EquityCalculator;
+  private samples: number;
+  private random: () => number;
+  private cache: LRUCache<string, EquityResult>;
+  /** Preflop estimates by starting hand class and opponent count, filled on first use */
+  private preflop: Map<number, EquityResult> = new Map();
+
+  constructor(options: EquityCalculatorOptions = {}) {
+    this.samples = options.samples ?? 5000;
+    this.random =
+      options.random ??
+      (options.seed !== undefined ? seededRandom(options.seed) : Math.random);
+    // Estimates do not go stale; the same street is re-queried until the table changes
+    this.cache = new LRUCache<string, EquityResult>({
+      maxSize: options.cacheSize ?? 128,
+      ttlMs: Number.POSITIVE_INFINITY,
+      hashFn: (key) => key,
+    });
+  }
+
+  /**
+   * Shared calculator with default options, so callers pool one cache and preflop table
+   * instead of each allocating their own.
+   */
+  public static getInstance(): EquityCalculator {
+    if (!EquityCalculator.instance) {
+      EquityCalculator.instance = new EquityCalculator();
+    }
+    return EquityCalculator.instance;
+  }
+
+  /**
+   * Estimates hero's equity against `opponents` random hands.
+   */
+  calculate(holeCards: readonly Card[], board: readonly Card[] = [], opponents = 1): EquityResult {
+    if (holeCards.length !== 2) {
+      throw new Error(`Expected 2 hole cards, got ${holeCards.length}`);
+    }
+    if (board.length > 5) {
+      throw new Error(`Expected at most 5 board cards, got ${board.length}`);
+    }
+    if (opponents < 1) {
+      throw new Error(`Expected at least one opponent, got ${opponents}`);
+    }
+
+    const hole = holeCards.map(encodeCard);
+    const boardCodes = board.map(encodeCard);
+    // Flags the known cards by deck index, catching duplicates on the way
+    const known = new Uint8Array(DECK_CODES.length);
+    for (const code of [...hole, ...boardCodes]) {
+      const index = deckIndex(code);
+      if (known[index]) {
+        throw new Error('Hole and board cards must be distinct');
+      }
+      known[index] = 1;
+    }
+    // Preflop equity depends only on the 169 starting hand classes, not on exact suits
+    const preflopKey =
+      boardCodes.length === 0 ? startingHandClass(hole[0], hole[1]) + 169 * opponents : -1;
+    const cacheKey = equityCacheKey(hole, boardCodes, opponents);
+    const cached = preflopKey >= 0 ? this.preflop.get(preflopKey) : this.cache.get(cacheKey);
+    if (cached) {
+      return cached;
+    }
+
+    // Indices into DECK_CODES of the cards left to deal
+    const deck: number[] = [];
+    for (let index = 0; index < known.length; index++) {
+      if (!known[index]) {
+        deck.push(index);
+      }
+    }
+    const boardNeeded = 5 - boardCodes.length;
+    const cardsDealt = boardNeeded + opponents * 2;
+    if (deck.length < cardsDealt) {
+      throw new Error(`Not enough cards left to deal ${opponents} opponents`);
+    }
+
+    const heroCodes = new Uint32Array(7);
+    heroCodes.set(hole);
+    heroCodes.set(boardCodes, 2);
+    const runoutBoard = heroCodes.subarray(2); // View of the board shared by every hand
+    // Hero's score depends only on which board cards are drawn. With at most two to draw,
+    // scores are memoized by the combinatorial address of the drawn card indices.
+    const heroMemo = boardNeeded <= 2 ? new Uint16Array(DRAW_ADDRESSES[boardNeeded]) : null;
+
+    const codes = new Uint32Array(BATCH_SIZE * opponents * 7);
+    const scores = new Uint16Array(BATCH_SIZE * opponents);
+    const heroScores = new Uint16Array(BATCH_SIZE);
+    let wins = 0;
+    let ties = 0;
+    let equity = 0;
+
+    for (let done = 0; done < this.samples; done += BATCH_SIZE) {
+      const runouts = Math.min(BATCH_SIZE, this.samples - done);
+
+      for (let r = 0; r < runouts; r++) {
+        this.shuffle(deck, cardsDealt);
+        for (let i = 0; i < boardNeeded; i++) {
+          runoutBoard[boardCodes.length + i] = DECK_CODES[deck[i]];
+        }
+
+        const address = heroMemo ? drawAddress(deck, boardNeeded) : 0;
+        let hero = heroMemo ? heroMemo[address] : 0;
+        if (!hero) {
+          hero = evaluateCodes(heroCodes);
+          if (heroMemo) {
+            heroMemo[address] = hero;
+          }
+        }
+        heroScores[r] = hero;
+
+        // Each opponent's two cards from the rest of the deck, followed by the board
+        let offset = r * opponents * 7;
+        for (let opponent = 0; opponent < opponents; opponent++, offset += 7) {
+          const dealt = boardNeeded + opponent * 2;
+          codes[offset] = DECK_CODES[deck[dealt]];
+          codes[offset + 1] = DECK_CODES[deck[dealt + 1]];
+          codes.set(runoutBoard, offset + 2);
+        }
+      }
+
+      const handCount = runouts * opponents;
+      evaluateBatch(codes.subarray(0, handCount * 7), 7, scores.subarray(0, handCount));
+
+      for (let r = 0; r < runouts; r++) {
+        const base = r * opponents;
+        const hero = heroScores[r];
+        let bestOpponent = Infinity;
+        let tiedOpponents = 0;
+        for (let opponent = 0; opponent < opponents; opponent++) {
+          const score = scores[base + opponent];
+          if (score < bestOpponent) {
+            bestOpponent = score;
+            tiedOpponents = 1;
+          } else if (score === bestOpponent) {
+            tiedOpponents++;
+          }
+        }
+        if (hero < bestOpponent) {
+          wins++;
+          equity++;
+        } else if (hero === bestOpponent) {
+          ties++;
+          equity += 1 / (tiedOpponents + 1);
+        }
+      }
+    }
+
+    const result: EquityResult = {
+      win: wins / this.samples,
+      tie: ties / this.samples,
+      equity: equity / this.samples,
+      samples: this.samples,
+    };
+    if (preflopKey >= 0) {
+      this.preflop.set(preflopKey, result);
+    } else {
+      this.cache.set(cacheKey, result);
+    }
+    return result;
+  }
+
+  /**
+   * Partial Fisher-Yates: randomizes only the first `count` positions of the deck, which is
+   * all a runout deals. The rest of the deck stays a valid pool for the next runout.
+   */
+  private shuffle(deck: number[], count: number): void {
+    for (let i = 0; i < count; i++) {
+      const j = i + Math.floor(this.random() * (deck.length - i));
+      const card = deck[i];
+      deck[i] = deck[j];
+      deck[j] = card;
+    }
+  }
+}
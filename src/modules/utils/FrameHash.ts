@@ -0,0 +1,27 @@
+/**
+ * Fast change detection for captured frames.
+ * Used by the orchestrators to skip the extraction/decision pipeline when the
+ * table has not changed since the previous frame.
+ */
+
+const FNV_OFFSET_BASIS = 0x811c9dc5;
+const FNV_PRIME = 0x01000193;
+
+/**
+ * Hashes a strided sample of the frame bytes plus the full tail (FNV-1a).
+ * For PNG captures the tail holds the zlib Adler-32 of the pixel data and the
+ * final chunk CRC, so any pixel change alters the hash while only about
+ * 1/stride of the encoded bytes are read.
+ */
+export function frameHash(bytes: Uint8Array, stride: number = 16, tailLength: number = 64): number {
+  let hash = FNV_OFFSET_BASIS ^ bytes.length;
+  const tailStart = Math.max(0, bytes.length - tailLength);
+
+  for (let i = 0; i < tailStart; i += stride) {
+    hash = Math.imul(hash ^ bytes[i], FNV_PRIME);
+  }
+  for (let i = tailStart; i < bytes.length; i++) {
+    hash = Math.imul(hash ^ bytes[i], FNV_PRIME);
+  }
+  return hash >>> 0;
+}
@@ -0,0 +1,422 @@
+/**
+ * Table-driven poker hand evaluator (Cactus Kev encoding).
+ * Cards are packed into 32-bit codes: one-hot rank in bits 16-28, one-hot suit in
+ * bits 12-15, rank index in bits 8-11 and the rank prime in bits 0-7. A five-card hand
+ * resolves to its equivalence class, from 1 (royal flush) to 7462 (7-5-4-3-2 offsuit),
+ * with at most three table lookups: flushes by rank mask, five distinct ranks by rank
+ * mask, and everything else by the product of the rank primes. Six- and seven-card
+ * hands are resolved in a single pass over the cards: one flush lookup by suited rank
+ * mask, else one lookup of the best non-flush value by rank-prime product.
+ */
+
+import { Card, Rank, Suit } from '../../shared/types/GameState';
+
+export type HandCategory =
+  | 'straight-flush'
+  | 'four-of-a-kind'
+  | 'full-house'
+  | 'flush'
+  | 'straight'
+  | 'three-of-a-kind'
+  | 'two-pair'
+  | 'pair'
+  | 'high-card';
+
+/** Value of the weakest five-card hand; lower values are stronger */
+export const WORST_HAND_VALUE = 7462;
+
+/** Ranks from deuce (index 0) to ace (index 12) */
+const RANK_ORDER: readonly Rank[] = [
+  '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A',
+];
+const RANK_PRIMES: readonly number[] = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41];
+/** Suits in one-hot bit order, from bit 12 (spades) to bit 15 (clubs) */
+const SUIT_ORDER: readonly Suit[] = ['s', 'h', 'd', 'c'];
+
+/** Rank index by the char code of the rank's first character ('1' for '10') */
+const RANK_BY_CHAR = new Uint8Array(128);
+/** Suit index by the char code of the suit */
+const SUIT_BY_CHAR = new Uint8Array(128);
+for (let i = 0; i < RANK_ORDER.length; i++) {
+  RANK_BY_CHAR[RANK_ORDER[i].charCodeAt(0)] = i;
+}
+for (let i = 0; i < SUIT_ORDER.length; i++) {
+  SUIT_BY_CHAR[SUIT_ORDER[i].charCodeAt(0)] = i;
+}
+
+/** Evaluator code of every card, indexed by rank index * 4 + suit index */
+const CARD_CODES = Uint32Array.from({ length: 52 }, (_, i) => {
+  const rank = i >> 2;
+  return (1 << (16 + rank)) | (0x1000 << (i & 3)) | (rank << 8) | RANK_PRIMES[rank];
+});
+
+/** Evaluator codes of the full 52-card deck */
+export const DECK_CODES: readonly number[] = Array.from(CARD_CODES);
+
+/** Scratch buffer reused by evaluateHand */
+const HAND_CODES = new Uint32Array(7);
+
+/** Categories from strongest to weakest */
+const CATEGORIES: readonly HandCategory[] = [
+  'straight-flush',
+  'four-of-a-kind',
+  'full-house',
+  'flush',
+  'straight',
+  'three-of-a-kind',
+  'two-pair',
+  'pair',
+  'high-card',
+];
+/** Upper value bound of each category, in CATEGORIES order */
+const CATEGORY_BOUNDS: readonly number[] = [10, 166, 322, 1599, 1609, 2467, 3325, 6185, 7462];
+/** Index into CATEGORIES for every hand value */
+const CATEGORY_BY_VALUE = new Uint8Array(WORST_HAND_VALUE + 1);
+
+/** Best flush value indexed by the 13-bit rank mask of 5-7 suited cards (0 below five) */
+const FLUSH_VALUES = new Uint16Array(1 << 13);
+/** Hand values indexed by the 13-bit rank mask of five distinct unsuited ranks */
+const UNIQUE5_VALUES = new Uint16Array(1 << 13);
+/** Hand values of paired hands keyed by the product of their rank primes */
+const PRODUCT_VALUES = new Map<number, number>();
+/** Best non-flush value of 6-7 cards keyed by the product of their rank primes */
+const OFFSUIT_VALUES = new Map<number, number>();
+
+/** Per-suit counter increment (one nibble per suit) indexed by the one-hot suit bits */
+const SUIT_COUNT_INCREMENT = Uint16Array.from([0, 0x1, 0x10, 0, 0x100, 0, 0, 0, 0x1000]);
+
+/** Flattened five-card index subsets for 6 and 7 cards (5 indices per subset) */
+const SUBSETS: readonly Uint8Array[] = [6, 7].map(buildSubsets);
+
+/** Whether the lookup tables have been filled; they are built on first evaluation */
+let tablesBuilt = false;
+
+/**
+ * Lists every five-card index subset of `n` cards, flattened into one array.
+ */
+function buildSubsets(n: number): Uint8Array {
+  const subsets: number[] = [];
+  for (let a = 0; a < n; a++) {
+    for (let b = a + 1; b < n; b++) {
+      for (let c = b + 1; c < n; c++) {
+        for (let d = c + 1; d < n; d++) {
+          for (let e = d + 1; e < n; e++) {
+            subsets.push(a, b, c, d, e);
+          }
+        }
+      }
+    }
+  }
+  return Uint8Array.from(subsets);
+}
+
+/**
+ * Builds the lookup tables unless already built. Deferred from module load so importing
+ * the evaluator costs nothing until a hand is actually evaluated.
+ */
+function ensureTables(): void {
+  if (!tablesBuilt) {
+    buildTables();
+    tablesBuilt = true;
+  }
+}
+
+/**
+ * Fills the lookup tables by walking every equivalence class from strongest to weakest.
+ */
+function buildTables(): void {
+  const straights: number[] = [];
+  for (let high = 12; high >= 4; high--) {
+    straights.push(0x1f << (high - 4));
+  }
+  straights.push(0x100f); // wheel: A-2-3-4-5
+
+  // Five distinct ranks in descending order; numeric mask order matches rank order
+  const highCards: number[] = [];
+  for (let mask = 0x1f00; mask >= 0x1f; mask--) {
+    if (popCount(mask) === 5 && !straights.includes(mask)) {
+      highCards.push(mask);
+    }
+  }
+
+  const p = RANK_PRIMES;
+  let value = 1;
+  for (const mask of straights) {
+    FLUSH_VALUES[mask] = value++;
+  }
+  for (let quad = 12; quad >= 0; quad--) {
+    for (let kicker = 12; kicker >= 0; kicker--) {
+      if (kicker !== quad) {
+        PRODUCT_VALUES.set(p[quad] ** 4 * p[kicker], value++);
+      }
+    }
+  }
+  for (let trip = 12; trip >= 0; trip--) {
+    for (let pair = 12; pair >= 0; pair--) {
+      if (pair !== trip) {
+        PRODUCT_VALUES.set(p[trip] ** 3 * p[pair] ** 2, value++);
+      }
+    }
+  }
+  for (const mask of highCards) {
+    FLUSH_VALUES[mask] = value++;
+  }
+  for (const mask of straights) {
+    UNIQUE5_VALUES[mask] = value++;
+  }
+  for (let trip = 12; trip >= 0; trip--) {
+    for (let k1 = 12; k1 >= 0; k1--) {
+      for (let k2 = k1 - 1; k2 >= 0; k2--) {
+        if (k1 !== trip && k2 !== trip) {
+          PRODUCT_VALUES.set(p[trip] ** 3 * p[k1] * p[k2], value++);
+        }
+      }
+    }
+  }
+  for (let high = 12; high >= 0; high--) {
+    for (let low = high - 1; low >= 0; low--) {
+      for (let kicker = 12; kicker >= 0; kicker--) {
+        if (kicker !== high && kicker !== low) {
+          PRODUCT_VALUES.set(p[high] ** 2 * p[low] ** 2 * p[kicker], value++);
+        }
+      }
+    }
+  }
+  for (let pair = 12; pair >= 0; pair--) {
+    for (let k1 = 12; k1 >= 0; k1--) {
+      for (let k2 = k1 - 1; k2 >= 0; k2--) {
+        for (let k3 = k2 - 1; k3 >= 0; k3--) {
+          if (k1 !== pair && k2 !== pair && k3 !== pair) {
+            PRODUCT_VALUES.set(p[pair] ** 2 * p[k1] * p[k2] * p[k3], value++);
+          }
+        }
+      }
+    }
+  }
+  for (const mask of highCards) {
+    UNIQUE5_VALUES[mask] = value++;
+  }
+
+  // Six and seven suited cards: best of the masks with one rank removed
+  for (let mask = 0; mask < FLUSH_VALUES.length; mask++) {
+    const bits = popCount(mask);
+    if (bits === 6 || bits === 7) {
+      let best = WORST_HAND_VALUE;
+      for (let m = mask; m; m &= m - 1) {
+        best = Math.min(best, FLUSH_VALUES[mask & ~(m & -m)]);
+      }
+      FLUSH_VALUES[mask] = best;
+    }
+  }
+
+  for (let v = 1, category = 0; v <= WORST_HAND_VALUE; v++) {
+    if (v > CATEGORY_BOUNDS[category]) {
+      category++;
+    }
+    CATEGORY_BY_VALUE[v] = category;
+  }
+
+  for (let count = 6; count <= 7; count++) {
+    addOffsuitValues(new Uint32Array(count), new Uint8Array(13), 0, 0);
+  }
+}
+
+/**
+ * Enumerates every rank multiset filling `codes` from `depth` on (ranks non-decreasing,
+ * at most four of each) and stores its best non-flush value under its prime product.
+ */
+function addOffsuitValues(
+  codes: Uint32Array,
+  rankCounts: Uint8Array,
+  depth: number,
+  minRank: number
+): void {
+  if (depth === codes.length) {
+    const subsets = SUBSETS[codes.length - 6];
+    let best = WORST_HAND_VALUE;
+    let product = 1;
+    for (let i = 0; i < codes.length; i++) {
+      product *= codes[i] & 0xff;
+    }
+    for (let i = 0; i < subsets.length; i += 5) {
+      best = Math.min(
+        best,
+        evaluateOffsuit(
+          codes[subsets[i]],
+          codes[subsets[i + 1]],
+          codes[subsets[i + 2]],
+          codes[subsets[i + 3]],
+          codes[subsets[i + 4]]
+        )
+      );
+    }
+    OFFSUIT_VALUES.set(product, best);
+    return;
+  }
+  for (let rank = minRank; rank < 13; rank++) {
+    // Each extra copy of a rank takes the next suit, so the cards stay distinct
+    const copies = rankCounts[rank];
+    if (copies < 4) {
+      codes[depth] = CARD_CODES[rank * 4 + copies];
+      rankCounts[rank]++;
+      addOffsuitValues(codes, rankCounts, depth + 1, rank);
+      rankCounts[rank]--;
+    }
+  }
+}
+
+function popCount(mask: number): number {
+  let count = 0;
+  for (let m = mask; m; m &= m - 1) {
+    count++;
+  }
+  return count;
+}
+
+/**
+ * Builds the lookup tables now rather than on the first evaluation, so callers with a
+ * latency budget can pay the one-off cost at startup.
+ */
+export function warmUp(): void {
+  ensureTables();
+}
+
+/**
+ * Packs a card into its 32-bit evaluator code.
+ */
+export function encodeCard(card: Card): number {
+  const rank = RANK_BY_CHAR[card.rank.charCodeAt(0)];
+  return CARD_CODES[rank * 4 + SUIT_BY_CHAR[card.suit.charCodeAt(0)]];
+}
+
+/**
+ * Encodes cards into `out` (allocated when omitted) without intermediate arrays.
+ */
+export function encodeCards(
+  cards: readonly Card[],
+  out: Uint32Array = new Uint32Array(cards.length)
+): Uint32Array {
+  for (let i = 0; i < cards.length; i++) {
+    out[i] = encodeCard(cards[i]);
+  }
+  return out;
+}
+
+/**
+ * Evaluates five encoded cards. Returns 1 (royal flush) to 7462 (worst high card).
+ */
+export function evaluate5(c0: number, c1: number, c2: number, c3: number, c4: number): number {
+  ensureTables();
+  return lookup5(c0, c1, c2, c3, c4);
+}
+
+/**
+ * Five-card lookup on built tables: flush by rank mask, else the offsuit kernel.
+ */
+function lookup5(c0: number, c1: number, c2: number, c3: number, c4: number): number {
+  if (c0 & c1 & c2 & c3 & c4 & 0xf000) {
+    return FLUSH_VALUES[(c0 | c1 | c2 | c3 | c4) >> 16];
+  }
+  return evaluateOffsuit(c0, c1, c2, c3, c4);
+}
+
+/**
+ * Evaluates five encoded cards already known not to form a flush.
+ */
+function evaluateOffsuit(c0: number, c1: number, c2: number, c3: number, c4: number): number {
+  const unique = UNIQUE5_VALUES[(c0 | c1 | c2 | c3 | c4) >> 16];
+  if (unique) {
+    return unique;
+  }
+  return PRODUCT_VALUES.get(
+    (c0 & 0xff) * (c1 & 0xff) * (c2 & 0xff) * (c3 & 0xff) * (c4 & 0xff)
+  )!;
+}
+
+/**
+ * Evaluates the best five-card hand out of 5-7 encoded cards.
+ */
+export function evaluateCodes(codes: ArrayLike<number>): number {
+  ensureTables();
+  return evaluateRange(codes, 0, codes.length);
+}
+
+/**
+ * Evaluates many hands stored back to back in `codes`, `cardsPerHand` codes each,
+ * writing one value per hand into `out` (allocated when omitted).
+ */
+export function evaluateBatch(
+  codes: Uint32Array,
+  cardsPerHand: number,
+  out: Uint16Array = new Uint16Array(Math.floor(codes.length / cardsPerHand))
+): Uint16Array {
+  ensureTables();
+  for (let hand = 0, start = 0; hand < out.length; hand++, start += cardsPerHand) {
+    out[hand] = evaluateRange(codes, start, cardsPerHand);
+  }
+  return out;
+}
+
+/**
+ * Evaluates the best five-card hand among `count` codes starting at `start`.
+ */
+function evaluateRange(codes: ArrayLike<number>, start: number, count: number): number {
+  if (count === 5) {
+    // Exactly five cards: the direct lookup avoids the suit pass and the product Map
+    return lookup5(
+      codes[start],
+      codes[start + 1],
+      codes[start + 2],
+      codes[start + 3],
+      codes[start + 4]
+    );
+  }
+  const end = start + count;
+
+  // One pass packs a 4-bit count per suit into one integer and multiplies the rank primes.
+  // With at most seven cards, five or more of one suit rule out quads and full houses, so
+  // the best flush in that suit is the answer; otherwise the product keys the best
+  // non-flush value.
+  let suitCounts = 0;
+  let product = 1;
+  for (let i = start; i < end; i++) {
+    const code = codes[i];
+    suitCounts += SUIT_COUNT_INCREMENT[(code >> 12) & 0xf];
+    product *= code & 0xff;
+  }
+  // Adding 3 to every nibble carries a count of five or more into its top bit
+  const flushNibble = (suitCounts + 0x3333) & 0x8888;
+  if (flushNibble) {
+    const suitBit = 0x1000 << ((31 - Math.clz32(flushNibble)) >> 2);
+    let rankMask = 0;
+    for (let i = start; i < end; i++) {
+      if (codes[i] & suitBit) {
+        rankMask |= codes[i] >> 16;
+      }
+    }
+    return FLUSH_VALUES[rankMask];
+  }
+  return OFFSUIT_VALUES.get(product)!;
+}
+
+/**
+ * Evaluates the best five-card hand out of 5-7 cards (e.g. hole cards plus board).
+ */
+export function evaluateHand(cards: readonly Card[]): number {
+  if (cards.length < 5 || cards.length > 7) {
+    throw new Error(`evaluateHand expects 5-7 cards, got ${cards.length}`);
+  }
+  ensureTables();
+  return evaluateRange(encodeCards(cards, HAND_CODES), 0, cards.length);
+}
+
+/**
+ * Maps a hand value to its category.
+ */
+export function handCategory(value: number): HandCategory {
+  if (!Number.isInteger(value) || value < 1 || value > WORST_HAND_VALUE) {
+    throw new Error(`Invalid hand value: ${value}`);
+  }
+  ensureTables();
+  return CATEGORIES[CATEGORY_BY_VALUE[value]];
+}
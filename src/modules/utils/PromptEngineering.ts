@@ -23,6 +23,27 @@ export interface PromptContext {
   phase: PokerPhase;
 }
 
+const DEFAULT_PHASE_TEMPLATE = 'You are an expert poker strategist. Analyze the situation:';
+
+/** Phase templates, resolved once instead of per prompt */
+const PHASE_TEMPLATES: Readonly<Record<PokerPhase, string>> = {
+  [PokerPhase.PREFLOP]: 'You are an expert poker strategist. Analyze the preflop situation:',
+  [PokerPhase.FLOP]: 'You are an expert poker strategist. Analyze the flop situation:',
+  [PokerPhase.TURN]: 'You are an expert poker strategist. Analyze the turn situation:',
+  [PokerPhase.RIVER]: 'You are an expert poker strategist. Analyze the river situation:',
+  [PokerPhase.SHOWDOWN]: 'You are an expert poker strategist. Analyze the showdown:',
+};
+
+/** Accepted spellings of each action in LLM responses */
+const ACTION_LOOKUP: ReadonlyMap<string, PokerAction> = new Map([
+  ['fold', PokerAction.FOLD],
+  ['call', PokerAction.CALL],
+  ['raise', PokerAction.RAISE],
+  ['all-in', PokerAction.ALL_IN],
+  ['allin', PokerAction.ALL_IN],
+  ['all in', PokerAction.ALL_IN],
+]);
+
 export class PromptEngineering {
   /**
    * Formats a GameState and context into a prompt for the LLM.
@@ -51,24 +72,29 @@ Based on the above, recommend the optimal action (fold, call, raise, all-in) wit
 {"action": "...", "confidence": 0.0, "rationale": "..."}`;
   }
 
+  /**
+   * Derives the strategic context for a prompt from an extracted GameState.
+   */
+  static buildContext(gameState: GameState): PromptContext {
+    const toCall = gameState.currentBet;
+    const stackSizes: Record<string, number> = {};
+    for (const player of gameState.players) {
+      stackSizes[player.name ?? `seat ${player.position}`] = player.chips;
+    }
+    return {
+      potOdds: toCall > 0 ? toCall / (gameState.pot + toCall) : 0,
+      position: `seat ${gameState.heroPosition}`,
+      stackSizes,
+      // Both phase enums share their string values; 'unknown' gets the default template
+      phase: gameState.phase as string as PokerPhase,
+    };
+  }
+
   /**
    * Returns a prompt template for the given poker phase.
    */
   static getPhaseTemplate(phase: PokerPhase): string {
-    switch (phase) {
-      case PokerPhase.PREFLOP:
-        return 'You are an expert poker strategist. Analyze the preflop situation:';
-      case PokerPhase.FLOP:
-        return 'You are an expert poker strategist. Analyze the flop situation:';
-      case PokerPhase.TURN:
-        return 'You are an expert poker strategist. Analyze the turn situation:';
-      case PokerPhase.RIVER:
-        return 'You are an expert poker strategist. Analyze the river situation:';
-      case PokerPhase.SHOWDOWN:
-        return 'You are an expert poker strategist. Analyze the showdown:';
-      default:
-        return 'You are an expert poker strategist. Analyze the situation:';
-    }
+    return PHASE_TEMPLATES[phase] ?? DEFAULT_PHASE_TEMPLATE;
   }
 
   /**
@@ -106,20 +132,6 @@ Based on the above, recommend the optimal action (fold, call, raise, all-in) wit
    * Normalizes action string to PokerAction enum.
    */
   static normalizeAction(action: string): PokerAction | null {
-    const a = action.trim().toLowerCase();
-    switch (a) {
-      case 'fold':
-        return PokerAction.FOLD;
-      case 'call':
-        return PokerAction.CALL;
-      case 'raise':
-        return PokerAction.RAISE;
-      case 'all-in':
-      case 'allin':
-      case 'all in':
-        return PokerAction.ALL_IN;
-      default:
-        return null;
-    }
+    return ACTION_LOOKUP.get(action.trim().toLowerCase()) ?? null;
   }
-}
\ No newline at end of file
+}
@@ -2,6 +2,8 @@ import { Logger } from '../../utils/logger';
 import { VisionModelService } from '../vision/VisionModelService';
 import { EventEmitter } from 'events';
 import { GameState } from '../../shared/types/GameState';
+import { EquityCalculator } from '../../modules/utils/EquityCalculator';
+import { warmUp as warmUpHandEvaluator } from '../../modules/utils/HandEvaluator';
 
 export interface AgentConfig {
   id: string;
@@ -34,12 +36,26 @@ export interface WorkflowResult {
   metadata: Record<string, any>;
 }
 
+/**
+ * Alternative lines for every combination of (unopened pot, deep enough to overbet),
+ * indexed by unopened * 2 + overbet. Built once and shared by every recommendation.
+ */
+const ALTERNATIVES: readonly (readonly string[])[] = [
+  ['time-bank for information'],
+  ['overbet', 'time-bank for information'],
+  ['check-raise', 'time-bank for information'],
+  ['check-raise', 'overbet', 'time-bank for information'],
+].map((lines) => Object.freeze(lines));
+
 export class GoogleADKWorkflow extends EventEmitter {
   private config: WorkflowConfig;
   private logger: Logger;
   private visionService: VisionModelService;
   private agents: Map<string, AgentConfig> = new Map();
+  private agentsByRole: Map<AgentConfig['role'], AgentConfig> = new Map();
   private messageHistory: AgentMessage[] = [];
+  private workflowStartTime: number = 0;
+  private equityCalculator = EquityCalculator.getInstance();
 
   constructor(
     config: WorkflowConfig,
@@ -53,11 +69,18 @@ export class GoogleADKWorkflow extends EventEmitter {
     
     // Initialize agents
     this.initializeAgents();
+
+    // Build the hand evaluator tables now so the first decision stays within budget
+    warmUpHandEvaluator();
   }
 
   private initializeAgents(): void {
     for (const agentConfig of this.config.agents) {
       this.agents.set(agentConfig.id, agentConfig);
+      // First agent configured for a role handles it
+      if (!this.agentsByRole.has(agentConfig.role)) {
+        this.agentsByRole.set(agentConfig.role, agentConfig);
+      }
       this.logger.info(`Initialized agent: ${agentConfig.id} (${agentConfig.role})`);
     }
   }
@@ -68,16 +91,20 @@ export class GoogleADKWorkflow extends EventEmitter {
   ): Promise<WorkflowResult> {
     try {
       const startTime = performance.now();
+      this.workflowStartTime = startTime;
       this.messageHistory = [];
 
-      // Step 1: Vision Agent - Extract visual information
-      const visionAnalysis = await this.runVisionAgent(screenshot);
+      // Step 1: Vision Agent - Extract visual information. Equity depends only on the
+      // game state, so it is estimated while the vision request is in flight.
+      const pendingVision = this.runVisionAgent(screenshot);
+      const equity = this.estimateEquity(gameState);
+      const visionAnalysis = await pendingVision;
       
       // Step 2: Analysis Agent - Interpret game state
       const gameAnalysis = await this.runAnalysisAgent(visionAnalysis, gameState);
       
       // Step 3: Strategy Agent - Generate recommendations
-      const strategyRecommendation = await this.runStrategyAgent(gameAnalysis, gameState);
+      const strategyRecommendation = await this.runStrategyAgent(gameAnalysis, gameState, equity);
       
       // Step 4: Coordinator Agent - Synthesize final decision
       const finalDecision = await this.runCoordinatorAgent(
@@ -178,7 +205,8 @@ Format as structured JSON.`;
 
   private async runStrategyAgent(
     analysis: AgentMessage,
-    gameState: GameState
+    gameState: GameState,
+    equity: number
   ): Promise<AgentMessage> {
     const agent = this.getAgentByRole('strategy');
     if (!agent) {
@@ -193,7 +221,7 @@ Format as structured JSON.`;
       sizing: this.calculateOptimalSizing(analysis.content, gameState),
       alternatives: this.generateAlternatives(gameState),
       riskLevel: this.assessRisk(gameState),
-      expectedValue: this.calculateEV(gameState),
+      expectedValue: this.calculateEV(gameState, equity),
       bluffFrequency: 0.33, // GTO baseline
       reasoning: 'Based on position, stack depth, and pot odds',
     };
@@ -258,7 +286,7 @@ Format as structured JSON.`;
       reasoning: recommendation.reasoning,
       agentContributions: this.messageHistory,
       metadata: {
-        processingTime: Date.now() - this.messageHistory[0].timestamp,
+        processingTime: performance.now() - this.workflowStartTime,
         agentCount: this.agents.size,
         iterations: 1,
       },
@@ -270,8 +298,8 @@ Format as structured JSON.`;
   }
 
   // Helper methods
-  private getAgentByRole(role: string): AgentConfig | undefined {
-    return Array.from(this.agents.values()).find(a => a.role === role);
+  private getAgentByRole(role: AgentConfig['role']): AgentConfig | undefined {
+    return this.agentsByRole.get(role);
   }
 
   private parseJSON(text: string): any {
@@ -371,20 +399,10 @@ Format as structured JSON.`;
     return pot * 0.67;
   }
 
-  private generateAlternatives(gameState: GameState): string[] {
-    const alternatives = [];
-    
-    if (gameState.currentBet === 0) {
-      alternatives.push('check-raise');
-    }
-    
-    if (gameState.playerChips && gameState.playerChips > gameState.pot * 3) {
-      alternatives.push('overbet');
-    }
-    
-    alternatives.push('time-bank for information');
-    
-    return alternatives;
+  private generateAlternatives(gameState: GameState): readonly string[] {
+    const unopened = gameState.currentBet === 0 ? 1 : 0;
+    const overbet = gameState.playerChips && gameState.playerChips > gameState.pot * 3 ? 1 : 0;
+    return ALTERNATIVES[unopened * 2 + overbet];
   }
 
   private assessRisk(gameState: GameState): string {
@@ -402,21 +420,46 @@ Format as structured JSON.`;
     return 'low';
   }
 
-  private calculateEV(gameState: GameState): Record<string, number> {
+  private calculateEV(gameState: GameState, equity: number): Record<string, number> {
     // Simplified EV calculation
     const pot = gameState.pot || 0;
     const bet = gameState.currentBet || 0;
-    
+
     return {
       fold: 0,
-      call: pot * 0.3 - bet, // Assume 30% equity
-      raise: pot * 0.4 - bet * 2.5, // Assume fold equity
+      call: pot * equity - bet,
+      raise: pot * (equity + 0.1) - bet * 2.5, // Assume fold equity
     };
   }
 
+  private estimateEquity(gameState: GameState): number {
+    const hand = gameState.playerHand;
+    if (hand?.length !== 2) {
+      return 0.3; // No hole cards visible: assume 30% equity
+    }
+    // Extraction does not set isHero; the hero is identified by seat
+    const opponents =
+      gameState.players?.filter(p => p.isActive && p.position !== gameState.heroPosition)
+        .length || 1;
+    
+    try {
+      return this.equityCalculator.calculate(hand, gameState.communityCards || [], opponents)
+        .equity;
+    } catch (error) {
+      // Inconsistent OCR (e.g. duplicate cards) falls back to the baseline
+      this.logger.warn('Equity calculation failed', {
+        error: error instanceof Error ? error.message : String(error),
+      });
+      return 0.3;
+    }
+  }
+
   private calculateConsensus(messages: AgentMessage[]): number {
-    const confidences = messages.map(m => m.confidence || 0.5);
-    return confidences.reduce((a, b) => a + b, 0) / confidences.length;
+    let total = 0;
+    for (const message of messages) {
+      total += message.confidence || 0.5;
+    }
+    return total / messages.length;
   }
 
   private identifyConflicts(messages: AgentMessage[]): string[] {
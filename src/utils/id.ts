@@ -0,0 +1,21 @@
+/**
+ * Identifier generation utility
+ *
+ * Produces unique ids for screenshots, game states and recommendations.
+ * Ids combine a timestamp, a per-process token drawn once at load and a
+ * monotonically increasing sequence, so no random draw is needed per id.
+ */
+
+import { randomBytes } from 'crypto';
+
+const PROCESS_TOKEN = randomBytes(4).toString('hex');
+let sequence = 0;
+
+/**
+ * Create a unique id of the form `<prefix>_<epoch ms>_<token><sequence>`.
+ * Callers that also stamp the record pass that timestamp so the clock is read once.
+ */
+export function createId(prefix: string, timestamp: number = Date.now()): string {
+  sequence = (sequence + 1) % Number.MAX_SAFE_INTEGER;
+  return `${prefix}_${timestamp}_${PROCESS_TOKEN}${sequence.toString(36)}`;
+}
@@ -43,11 +43,51 @@ export interface LoggerConfig {
 }
 
 /**
- * Centralized logging utility with structured output and level filtering
+ * Log level override from the LOG_LEVEL environment variable, parsed once at
+ * load instead of in every Logger constructor
+ */
+const ENV_LOG_LEVEL: LogLevel | undefined = (() => {
+  const envLevel = process.env['LOG_LEVEL']?.toUpperCase();
+  if (envLevel && LogLevel[envLevel as keyof typeof LogLevel] !== undefined) {
+    return LogLevel[envLevel as keyof typeof LogLevel];
+  }
+  return undefined;
+})();
+
+/** Entries held per output before new ones are dropped */
+const MAX_PENDING_ENTRIES = 1000;
+
+/**
+ * Loggers with queued output; drained synchronously if the process exits
+ * before their scheduled flush runs
+ */
+const loggersWithPendingOutput = new Set<Logger>();
+let exitFlushInstalled = false;
+
+function trackPendingOutput(logger: Logger): void {
+  loggersWithPendingOutput.add(logger);
+  if (!exitFlushInstalled) {
+    exitFlushInstalled = true;
+    process.once('exit', () => {
+      loggersWithPendingOutput.forEach((pending) => pending.flush());
+    });
+  }
+}
+
+/**
+ * Centralized logging utility with structured output and level filtering.
+ * Output is queued and written in batches after the caller returns, so
+ * console and file I/O stay off the pipeline's hot path.
  */
 export class Logger {
   private readonly component: string;
   private readonly config: LoggerConfig;
+  private pendingConsole: Array<{ level: LogLevel; message: string }> = [];
+  private pendingFile: string[] = [];
+  private flushScheduled: boolean = false;
+  private fileWriteInFlight: boolean = false;
+  private droppedConsole: number = 0;
+  private droppedFile: number = 0;
   private static globalConfig: LoggerConfig = {
     level: LogLevel.INFO,
     enableConsole: true,
@@ -61,9 +101,8 @@ export class Logger {
     this.config = { ...Logger.globalConfig, ...config };
     
     // Set log level from environment variable if available
-    const envLevel = process.env['LOG_LEVEL']?.toUpperCase();
-    if (envLevel && LogLevel[envLevel as keyof typeof LogLevel] !== undefined) {
-      this.config.level = LogLevel[envLevel as keyof typeof LogLevel];
+    if (ENV_LOG_LEVEL !== undefined) {
+      this.config.level = ENV_LOG_LEVEL;
     }
 
     this.initializeFileLogging();
@@ -134,18 +173,124 @@ export class Logger {
   }
 
   /**
-   * Write log entry to configured outputs
+   * Queue log entry for the configured outputs
    */
   private writeLog(entry: LogEntry): void {
     const formattedMessage = this.formatLogEntry(entry);
 
     if (this.config.enableConsole) {
-      this.writeToConsole(entry, formattedMessage);
+      if (this.pendingConsole.length < MAX_PENDING_ENTRIES) {
+        this.pendingConsole.push({ level: entry.level, message: formattedMessage });
+      } else {
+        this.droppedConsole++;
+      }
+    }
+
+    // File output backs up while an append is in flight, so it is capped too
+    if (this.config.enableFile && this.config.logDirectory) {
+      if (this.pendingFile.length < MAX_PENDING_ENTRIES) {
+        this.pendingFile.push(formattedMessage + '\n');
+      } else {
+        this.droppedFile++;
+      }
+    }
+
+    this.scheduleFlush();
+  }
+
+  /**
+   * Synchronously write all queued output (used on shutdown)
+   */
+  public flush(): void {
+    this.flushConsole();
+
+    if (this.pendingFile.length > 0 && this.config.logDirectory) {
+      const batch = this.takeFileBatch();
+      try {
+        fs.appendFileSync(path.join(this.config.logDirectory, 'application.log'), batch);
+      } catch (error) {
+        console.error('Failed to write to log file:', error);
+      }
+    }
+    loggersWithPendingOutput.delete(this);
+  }
+
+  /**
+   * Schedule a batched write on the next turn of the event loop
+   */
+  private scheduleFlush(): void {
+    if (this.flushScheduled) {
+      return;
+    }
+    this.flushScheduled = true;
+    trackPendingOutput(this);
+    setImmediate(() => this.drain());
+  }
+
+  /**
+   * Write queued console output and start one async append for queued file output
+   */
+  private drain(): void {
+    this.flushScheduled = false;
+    this.flushConsole();
+
+    if (this.pendingFile.length > 0 && !this.fileWriteInFlight) {
+      const batch = this.takeFileBatch();
+      this.fileWriteInFlight = true;
+      this.writeToFile(batch).finally(() => {
+        this.fileWriteInFlight = false;
+        if (this.pendingFile.length > 0) {
+          this.scheduleFlush();
+        }
+      });
+    }
+
+    if (this.pendingFile.length === 0) {
+      loggersWithPendingOutput.delete(this);
+    }
+  }
+
+  /**
+   * Write queued console output in order
+   */
+  private flushConsole(): void {
+    if (this.pendingConsole.length === 0) {
+      return;
+    }
+    const entries = this.pendingConsole;
+    this.pendingConsole = [];
+    for (const entry of entries) {
+      this.writeToConsole(entry.level, entry.message);
     }
+    if (this.droppedConsole > 0) {
+      this.writeToConsole(LogLevel.WARN, this.droppedNotice(this.droppedConsole));
+      this.droppedConsole = 0;
+    }
+  }
 
-    if (this.config.enableFile) {
-      this.writeToFile(formattedMessage);
+  /**
+   * Take queued file output as one string, noting any entries dropped since the last batch
+   */
+  private takeFileBatch(): string {
+    let batch = this.pendingFile.join('');
+    this.pendingFile = [];
+    if (this.droppedFile > 0) {
+      batch += this.droppedNotice(this.droppedFile) + '\n';
+      this.droppedFile = 0;
     }
+    return batch;
+  }
+
+  /**
+   * Log line reporting entries dropped from a full queue
+   */
+  private droppedNotice(count: number): string {
+    return this.formatLogEntry({
+      timestamp: new Date().toISOString(),
+      level: LogLevel.WARN,
+      component: this.component,
+      message: `Dropped ${count} log entries while output was backed up`,
+    });
   }
 
   /**
@@ -162,8 +307,8 @@ export class Logger {
   /**
    * Write to console with appropriate styling
    */
-  private writeToConsole(entry: LogEntry, message: string): void {
-    switch (entry.level) {
+  private writeToConsole(level: LogLevel, message: string): void {
+    switch (level) {
       case LogLevel.DEBUG:
         console.debug(message);
         break;
@@ -198,19 +343,19 @@ export class Logger {
   }
 
   /**
-   * Write to log file with rotation
+   * Append a batch of lines to the log file with rotation
    */
-  private writeToFile(message: string): void {
+  private async writeToFile(batch: string): Promise<void> {
     if (!this.config.logDirectory) {
       return;
     }
 
     try {
       const logFile = path.join(this.config.logDirectory, 'application.log');
-      fs.appendFileSync(logFile, message + '\n');
-      
+      await fs.promises.appendFile(logFile, batch);
+
       // Check if rotation is needed
-      this.rotateLogFileIfNeeded(logFile);
+      await this.rotateLogFileIfNeeded(logFile);
     } catch (error) {
       console.error('Failed to write to log file:', error);
     }
@@ -219,14 +364,14 @@ export class Logger {
   /**
    * Rotate log file if it exceeds maximum size
    */
-  private rotateLogFileIfNeeded(logFile: string): void {
+  private async rotateLogFileIfNeeded(logFile: string): Promise<void> {
     try {
-      const stats = fs.statSync(logFile);
+      const stats = await fs.promises.stat(logFile);
       if (stats.size > (this.config.maxFileSize || 10 * 1024 * 1024)) {
         const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
         const rotatedFile = logFile.replace('.log', `_${timestamp}.log`);
-        fs.renameSync(logFile, rotatedFile);
-        
+        await fs.promises.rename(logFile, rotatedFile);
+
         // Clean up old files
         this.cleanupOldLogFiles();
       }
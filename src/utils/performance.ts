@@ -7,10 +7,13 @@
  */
 
 import { Logger } from './logger';
-import { ConfigurationManager } from './config';
+import { AppConfig, ConfigurationManager } from './config';
 
 const logger = new Logger('PerformanceMonitor');
 
+/** Metrics kept in memory; once full, each new metric overwrites the oldest */
+const MAX_METRICS = 1000;
+
 /**
  * Performance metric data structure
  */
@@ -76,14 +79,18 @@ export class OperationTimer {
  */
 export class PerformanceMonitor {
   private static instance: PerformanceMonitor;
-  private config = ConfigurationManager.getInstance();
+  /** Performance settings, read once when the monitor is created */
+  private readonly settings: Readonly<AppConfig['performance']> =
+    ConfigurationManager.getInstance().getSection('performance');
+  /** Ring of recorded metrics; metricsNext is the slot the next metric overwrites once full */
   private metrics: PerformanceMetric[] = [];
+  private metricsNext = 0;
   private timers: Map<string, OperationTimer> = new Map();
   private lastCpuUsage: NodeJS.CpuUsage | null = null;
   private monitoringInterval?: NodeJS.Timeout | undefined;
 
   private constructor() {
-    if (this.config.getValue('performance', 'enableMetrics')) {
+    if (this.settings.enableMetrics) {
       this.startMonitoring();
       logger.info('Performance monitoring enabled');
     }
@@ -169,12 +176,12 @@ export class PerformanceMonitor {
    * Record a custom performance metric
    */
   public recordMetric(metric: PerformanceMetric): void {
-    this.metrics.push(metric);
-    
-    // Keep metrics within reasonable bounds
-    const maxMetrics = 1000;
-    if (this.metrics.length > maxMetrics) {
-      this.metrics = this.metrics.slice(-maxMetrics);
+    // Keep metrics within reasonable bounds without copying the history
+    if (this.metrics.length < MAX_METRICS) {
+      this.metrics.push(metric);
+    } else {
+      this.metrics[this.metricsNext] = metric;
+      this.metricsNext = (this.metricsNext + 1) % MAX_METRICS;
     }
 
     // Log warning if metric value is concerning
@@ -211,21 +218,23 @@ export class PerformanceMonitor {
     endTime?: number,
     category?: PerformanceMetric['category']
   ): PerformanceMetric[] {
-    let filtered = this.metrics;
-
-    if (startTime) {
-      filtered = filtered.filter(m => m.timestamp >= startTime);
-    }
-
-    if (endTime) {
-      filtered = filtered.filter(m => m.timestamp <= endTime);
-    }
-
-    if (category) {
-      filtered = filtered.filter(m => m.category === category);
+    const filtered: PerformanceMetric[] = [];
+    const count = this.metrics.length;
+
+    // Walk the ring oldest first, applying every filter in the same pass
+    for (let i = 0; i < count; i++) {
+      const metric = this.metrics[(this.metricsNext + i) % count];
+      if (
+        (startTime && metric.timestamp < startTime) ||
+        (endTime && metric.timestamp > endTime) ||
+        (category && metric.category !== category)
+      ) {
+        continue;
+      }
+      filtered.push(metric);
     }
 
-    return [...filtered];
+    return filtered;
   }
 
   /**
@@ -236,28 +245,25 @@ export class PerformanceMonitor {
     const windowStart = now - timeWindow;
     const recentMetrics = this.getMetrics(windowStart, now);
 
-    const categoriesStats: Record<string, unknown> = {};
-
-    // Group by category and calculate stats
-    const categories = recentMetrics.reduce((acc, metric) => {
-      if (!acc[metric.category]) {
-        acc[metric.category] = [];
-      }
-      acc[metric.category].push(metric.value);
-      return acc;
-    }, {} as Record<string, number[]>);
-
-    for (const [category, values] of Object.entries(categories)) {
-      if (values.length > 0) {
-        categoriesStats[category] = {
-          count: values.length,
-          average: values.reduce((a, b) => a + b, 0) / values.length,
-          min: Math.min(...values),
-          max: Math.max(...values),
-        };
+    // Accumulate running stats per category in one pass, without per-category value arrays
+    const totals: Record<string, { count: number; sum: number; min: number; max: number }> = {};
+    for (const { category, value } of recentMetrics) {
+      const total = totals[category];
+      if (total) {
+        total.count++;
+        total.sum += value;
+        total.min = Math.min(total.min, value);
+        total.max = Math.max(total.max, value);
+      } else {
+        totals[category] = { count: 1, sum: value, min: value, max: value };
       }
     }
 
+    const categoriesStats: Record<string, unknown> = {};
+    for (const [category, { count, sum, min, max }] of Object.entries(totals)) {
+      categoriesStats[category] = { count, average: sum / count, min, max };
+    }
+
     return {
       timeWindow: `${timeWindow / 1000}s`,
       totalMetrics: recentMetrics.length,
@@ -271,6 +277,7 @@ export class PerformanceMonitor {
    */
   public clearMetrics(): void {
     this.metrics = [];
+    this.metricsNext = 0;
     logger.debug('Performance metrics cleared');
   }
 
@@ -278,7 +285,7 @@ export class PerformanceMonitor {
    * Start continuous system monitoring
    */
   private startMonitoring(): void {
-    const sampleRate = this.config.getValue('performance', 'sampleRate');
+    const sampleRate = this.settings.sampleRate;
     const interval = Math.max(1000, 1000 / sampleRate); // At least 1 second intervals
 
     this.monitoringInterval = setInterval(() => {
@@ -306,7 +313,7 @@ export class PerformanceMonitor {
    * Check metric values against thresholds and log warnings
    */
   private checkMetricThresholds(metric: PerformanceMetric): void {
-    const maxMemory = this.config.getValue('performance', 'maxMemoryUsage');
+    const maxMemory = this.settings.maxMemoryUsage;
 
     switch (metric.category) {
       case 'memory':
@@ -363,7 +370,7 @@ export class PerformanceMonitor {
     return JSON.stringify({
       timestamp: Date.now(),
       summary: this.getSummary(),
-      metrics: this.metrics,
+      metrics: this.getMetrics(),
       systemResources: this.getSystemResources(),
     }, null, 2);
   }
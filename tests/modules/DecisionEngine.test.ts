@@ -158,6 +158,49 @@ describe('DecisionEngine', () => {
     expect(cached?.action).toBe(PokerAction.CALL);
   });
 
+  it('hits the cache for the same table composition captured at a different time', () => {
+    const engine = new DecisionEngine(config);
+    engine['cache'].set(mockGameState, {
+      action: PokerAction.CALL,
+      confidence: 0.7,
+      rationale: 'Cached',
+      timestamp: Date.now(),
+    });
+    const laterFrame: GameState = {
+      ...mockGameState,
+      communityCards: [...mockGameState.communityCards].reverse(),
+      timestamp: mockGameState.timestamp + 100,
+    };
+    expect(engine['cache'].get(laterFrame)?.action).toBe(PokerAction.CALL);
+  });
+
+  it('misses the cache when the hero hand or stack differs', () => {
+    const engine = new DecisionEngine(config);
+    const withHand: GameState = {
+      ...mockGameState,
+      playerHand: [
+        { rank: 'A', suit: 's' },
+        { rank: 'K', suit: 'd' },
+      ],
+      playerChips: 1000,
+    };
+    engine['cache'].set(withHand, {
+      action: PokerAction.RAISE,
+      confidence: 0.8,
+      rationale: 'Cached',
+      timestamp: Date.now(),
+    });
+    const otherHand: GameState = {
+      ...withHand,
+      playerHand: [
+        { rank: '7', suit: 'c' },
+        { rank: '2', suit: 'h' },
+      ],
+    };
+    expect(engine['cache'].get(otherHand)).toBeUndefined();
+    expect(engine['cache'].get({ ...withHand, playerChips: 40 })).toBeUndefined();
+  });
+
   it('handles rate limit with exponential backoff', async () => {
     const createMock = jest.fn()
       .mockRejectedValueOnce(new Error('rate limit'))
@@ -181,6 +224,52 @@ describe('DecisionEngine', () => {
     expect(createMock).toHaveBeenCalledTimes(3);
   });
 
+  it('shares one LLM call between concurrent requests for the same state', async () => {
+    const createMock = jest.fn().mockResolvedValue({
+      choices: [{ message: { content: JSON.stringify({
+        action: 'call',
+        confidence: 0.7,
+        rationale: 'Single flight'
+      }) } }]
+    });
+    const engine = new DecisionEngine(config, {
+      openAI: {
+        chat: {
+          completions: { create: createMock },
+        },
+      },
+    });
+    const [first, second] = await Promise.all([
+      engine['getRecommendation'](mockGameState, mockContext),
+      engine['getRecommendation'](mockGameState, mockContext),
+    ]);
+    expect(createMock).toHaveBeenCalledTimes(1);
+    expect(first.action).toBe(PokerAction.CALL);
+    expect(second.action).toBe(PokerAction.CALL);
+  });
+
+  it('makes separate LLM calls for the same state with different contexts', async () => {
+    const createMock = jest.fn().mockResolvedValue({
+      choices: [{ message: { content: JSON.stringify({
+        action: 'call',
+        confidence: 0.7,
+        rationale: 'Per context'
+      }) } }]
+    });
+    const engine = new DecisionEngine(config, {
+      openAI: {
+        chat: {
+          completions: { create: createMock },
+        },
+      },
+    });
+    await Promise.all([
+      engine['getRecommendation'](mockGameState, mockContext),
+      engine['getRecommendation'](mockGameState, { ...mockContext, potOdds: 0.5 }),
+    ]);
+    expect(createMock).toHaveBeenCalledTimes(2);
+  });
+
   it('completes recommendation in under 80ms (mocked)', async () => {
     const engine = new DecisionEngine(config, {
       openAI: {
@@ -0,0 +1,73 @@
+/**
+ * TDD tests for EquityCalculator.
+ * - Monte Carlo estimates land near known preflop equities.
+ * - Made hands on a complete board resolve exactly; invalid input is rejected.
+ */
+
+import { Card, Rank, Suit } from '../../src/shared/types/GameState';
+import { EquityCalculator } from '../../src/modules/utils/EquityCalculator';
+
+const hand = (labels: string): Card[] =>
+  labels.split(' ').map((label) => ({
+    rank: label.slice(0, -1) as Rank,
+    suit: label.slice(-1) as Suit,
+  }));
+
+describe('EquityCalculator', () => {
+  const calculator = new EquityCalculator({ samples: 20000, seed: 42 });
+
+  it('estimates pocket aces at about 85% heads-up', () => {
+    const result = calculator.calculate(hand('Ah As'));
+    expect(result.equity).toBeGreaterThan(0.83);
+    expect(result.equity).toBeLessThan(0.87);
+    expect(result.samples).toBe(20000);
+  });
+
+  it('loses equity against more opponents', () => {
+    const headsUp = calculator.calculate(hand('Ah Kh'), [], 1).equity;
+    const multiway = calculator.calculate(hand('Ah Kh'), [], 3).equity;
+    expect(multiway).toBeLessThan(headsUp);
+  });
+
+  it('estimates an overpair on a dry flop at about 88% heads-up', () => {
+    const result = calculator.calculate(hand('Ah As'), hand('Kd 7c 2s'));
+    expect(result.equity).toBeGreaterThan(0.86);
+    expect(result.equity).toBeLessThan(0.91);
+  });
+
+  it('wins every runout with a royal flush on a complete board', () => {
+    const result = calculator.calculate(hand('Ah Kh'), hand('Qh Jh 10h 2c 3d'), 2);
+    expect(result).toEqual({ win: 1, tie: 0, equity: 1, samples: 20000 });
+  });
+
+  it('splits the pot when the board plays', () => {
+    const result = calculator.calculate(hand('2c 3d'), hand('Ah Kh Qh Jh 10h'), 1);
+    expect(result.tie).toBe(1);
+    expect(result.equity).toBe(0.5);
+  });
+
+  it('serves repeated queries from the cache regardless of card order', () => {
+    const first = calculator.calculate(hand('Ah Kh'), hand('Qd 7c 2s'), 2);
+    expect(calculator.calculate(hand('Kh Ah'), hand('2s Qd 7c'), 2)).toBe(first);
+  });
+
+  it('shares preflop estimates between suit-isomorphic hands', () => {
+    const hearts = calculator.calculate(hand('Ah Kh'), [], 2);
+    expect(calculator.calculate(hand('Ks As'), [], 2)).toBe(hearts);
+    expect(calculator.calculate(hand('Ah Kd'), [], 2)).not.toBe(hearts);
+  });
+
+  it('reproduces estimates for the same seed', () => {
+    const estimate = () =>
+      new EquityCalculator({ samples: 2000, seed: 7 }).calculate(hand('Qh Jh'), hand('10h 2c 3d'));
+    expect(estimate()).toEqual(estimate());
+  });
+
+  it('shares one default calculator', () => {
+    expect(EquityCalculator.getInstance()).toBe(EquityCalculator.getInstance());
+  });
+
+  it('rejects duplicate cards', () => {
+    expect(() => calculator.calculate(hand('Ah Ah'))).toThrow();
+  });
+});
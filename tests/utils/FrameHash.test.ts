@@ -0,0 +1,36 @@
+/**
+ * TDD tests for frameHash.
+ * - Identical frames hash equally; changes in the sampled body or the tail are detected.
+ */
+
+import { frameHash } from '../../src/modules/utils/FrameHash';
+
+const makeFrame = (length: number): Uint8Array => {
+  const frame = new Uint8Array(length);
+  for (let i = 0; i < length; i++) {
+    frame[i] = (i * 31) & 0xff;
+  }
+  return frame;
+};
+
+describe('frameHash', () => {
+  it('returns the same hash for identical frames', () => {
+    expect(frameHash(makeFrame(4096))).toBe(frameHash(makeFrame(4096)));
+  });
+
+  it('detects a change in the frame tail', () => {
+    const changed = makeFrame(4096);
+    changed[4090] ^= 0xff;
+    expect(frameHash(changed)).not.toBe(frameHash(makeFrame(4096)));
+  });
+
+  it('detects a change at a sampled offset', () => {
+    const changed = makeFrame(4096);
+    changed[32] ^= 0xff;
+    expect(frameHash(changed)).not.toBe(frameHash(makeFrame(4096)));
+  });
+
+  it('detects a change in frame length', () => {
+    expect(frameHash(makeFrame(4095))).not.toBe(frameHash(makeFrame(4096)));
+  });
+});
@@ -0,0 +1,71 @@
+/**
+ * TDD tests for HandEvaluator.
+ * - Equivalence classes run from 1 (royal flush) to 7462 (7-5-4-3-2 offsuit).
+ * - Seven-card hands resolve to their best five-card subset.
+ */
+
+import { Card, Rank, Suit } from '../../src/shared/types/GameState';
+import {
+  encodeCard,
+  evaluateBatch,
+  evaluateHand,
+  handCategory,
+  WORST_HAND_VALUE,
+} from '../../src/modules/utils/HandEvaluator';
+
+const hand = (labels: string): Card[] =>
+  labels.split(' ').map((label) => ({
+    rank: label.slice(0, -1) as Rank,
+    suit: label.slice(-1) as Suit,
+  }));
+
+describe('HandEvaluator', () => {
+  it('ranks the royal flush best and 7-5-4-3-2 offsuit worst', () => {
+    expect(evaluateHand(hand('Ah Kh Qh Jh 10h'))).toBe(1);
+    expect(evaluateHand(hand('7h 5d 4c 3s 2h'))).toBe(WORST_HAND_VALUE);
+  });
+
+  it('treats the wheel as the lowest straight', () => {
+    const wheel = evaluateHand(hand('Ah 2d 3c 4s 5h'));
+    const sixHigh = evaluateHand(hand('6h 2d 3c 4s 5h'));
+    expect(handCategory(wheel)).toBe('straight');
+    expect(wheel).toBeGreaterThan(sixHigh);
+  });
+
+  it('orders categories from strongest to weakest', () => {
+    const values = [
+      'Ah Ad Ac As Kh',
+      'Kh Kd Kc 2s 2h',
+      '2h 4h 6h 8h 10h',
+      'Ah Kd Qc Js 10h',
+      '3h 3d 3c As Kh',
+      'Ah Ad Kc Ks 2h',
+      'Ah Ad Kc Qs Jh',
+      'Ah Kd Qc Js 9h',
+    ].map((labels) => evaluateHand(hand(labels)));
+    expect([...values].sort((a, b) => a - b)).toEqual(values);
+  });
+
+  it('picks the best five cards out of seven', () => {
+    const seven = evaluateHand(hand('Ah Ad 2c 7s 9h Kd Ks'));
+    expect(seven).toBe(evaluateHand(hand('Ah Ad Kd Ks 9h')));
+    expect(handCategory(seven)).toBe('two-pair');
+  });
+
+  it('finds the best flush among six or seven suited cards', () => {
+    expect(evaluateHand(hand('9h 8h 7h 6h 5h 2h Kd'))).toBe(evaluateHand(hand('9h 8h 7h 6h 5h')));
+    expect(evaluateHand(hand('Ah 9h 7h 5h 3h 2h Ad'))).toBe(evaluateHand(hand('Ah 9h 7h 5h 3h')));
+  });
+
+  it('evaluates packed batches the same as single hands', () => {
+    const hands = ['Ah Kh Qh Jh 10h 2c 3d', '7h 5d 4c 3s 2h 9c Jd', 'Ah Ad 2c 7s 9h Kd Ks'];
+    const codes = Uint32Array.from(hands.flatMap((labels) => hand(labels).map(encodeCard)));
+    expect(Array.from(evaluateBatch(codes, 7))).toEqual(
+      hands.map((labels) => evaluateHand(hand(labels)))
+    );
+  });
+
+  it('rejects hands outside 5-7 cards', () => {
+    expect(() => evaluateHand(hand('Ah Kd Qc Js'))).toThrow();
+  });
+});
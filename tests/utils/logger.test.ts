@@ -26,4 +26,27 @@ describe('Logger', () => {
       logger.debug('Test debug message');
     }).not.toThrow();
   });
-});
\ No newline at end of file
+
+  it('should defer console output until flushed', () => {
+    // Errors bypass the level filter, which jest.setup.js raises to 'error'
+    const errorSpy = jest.spyOn(console, 'error').mockImplementation(() => undefined);
+    logger.error('Queued message');
+    expect(errorSpy).not.toHaveBeenCalled();
+    logger.flush();
+    expect(errorSpy).toHaveBeenCalledWith(expect.stringContaining('Queued message'));
+    errorSpy.mockRestore();
+  });
+
+  it('should cap queued output and report dropped entries', () => {
+    const errorSpy = jest.spyOn(console, 'error').mockImplementation(() => undefined);
+    const warnSpy = jest.spyOn(console, 'warn').mockImplementation(() => undefined);
+    for (let i = 0; i < 1005; i++) {
+      logger.error(`Message ${i}`);
+    }
+    logger.flush();
+    expect(errorSpy).toHaveBeenCalledTimes(1000);
+    expect(warnSpy).toHaveBeenCalledWith(expect.stringContaining('Dropped 5 log entries'));
+    errorSpy.mockRestore();
+    warnSpy.mockRestore();
+  });
+});